@@ -4,10 +4,10 @@ import os
 import re
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel, Field
 
 from agentic_patterns.core.config.config import MAIN_PROJECT_DIR
+from agentic_patterns.core.config.utils import load_yaml
 
 
 class A2AClientConfig(BaseModel):
@@ -79,7 +79,7 @@ def load_a2a_settings(config_path: Path | str | None = None) -> A2ASettings:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with open(config_path) as f:
-        data = yaml.safe_load(f)
+        data = load_yaml(f)
 
     clients: dict[str, A2AClientConfig] = {}
     if "a2a" in data and "clients" in data["a2a"]:
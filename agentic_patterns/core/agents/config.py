@@ -4,9 +4,10 @@ Pydantic models for agent configurations.
 
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel, Field
 
+from agentic_patterns.core.config.utils import load_yaml
+
 
 class AzureConfig(BaseModel):
     """Configuration for Azure OpenAI models."""
@@ -92,7 +93,7 @@ def load_models(config_path: Path | str) -> Models:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with open(config_path) as f:
-        data = yaml.safe_load(f)
+        data = load_yaml(f)
 
     if not data or "models" not in data:
         raise ValueError("Configuration file must contain 'models' key")
@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Any, Sequence
 
 import rich
-import yaml
 from pydantic import BaseModel, ConfigDict
 from pydantic_ai import Agent, RunContext
 from pydantic_ai._agent_graph import CallToolsNode, ModelRequestNode
@@ -22,6 +21,7 @@ from agentic_patterns.core.a2a.tool import build_coordinator_prompt, create_a2a_
 from agentic_patterns.core.agents.agents import get_agent
 from agentic_patterns.core.agents.models import get_model
 from agentic_patterns.core.config.config import MAIN_PROJECT_DIR, PROMPTS_DIR
+from agentic_patterns.core.config.utils import load_yaml
 from agentic_patterns.core.mcp import MCPClientConfig, load_mcp_settings
 from agentic_patterns.core.skills.models import Skill, SkillMetadata
 from agentic_patterns.core.skills.registry import SkillRegistry
@@ -104,7 +104,7 @@ class AgentSpec(BaseModel):
             settings = load_mcp_settings(config_path)
             for mcp_name in mcp_server_names:
                 config = settings.get(mcp_name)
-                if isinstance(config, MCPClientConfig):
+                if config.type == "client":
                     mcp_servers.append(config)
 
         a2a_client_names = a2a_client_names or cfg.get("a2a_clients")
@@ -563,7 +563,7 @@ def _load_agent_config(name: str, config_path: Path | None = None) -> dict:
     if not path.exists():
         return {}
     with open(path) as f:
-        data = yaml.safe_load(f) or {}
+        data = load_yaml(f) or {}
     return data.get("agents", {}).get(name, {})
 
 
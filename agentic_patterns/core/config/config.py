@@ -1,8 +1,7 @@
 from pathlib import Path
 
-import yaml
-
 from agentic_patterns.core.config.env import get_variable_env, load_env_variables
+from agentic_patterns.core.config.utils import load_yaml
 
 
 FILE_PATH = Path(__file__).resolve()
@@ -39,7 +38,7 @@ def _load_auth_config() -> dict:
     config_path = MAIN_PROJECT_DIR / "config.yaml"
     if config_path.exists():
         with open(config_path) as f:
-            cfg = yaml.safe_load(f)
+            cfg = load_yaml(f)
             if cfg and "auth" in cfg:
                 return cfg["auth"]
     return {}
@@ -1,5 +1,13 @@
 from pathlib import Path
 import sys
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
 
 
 # Iterate over all parents of FILE_PATH to find .env files
@@ -22,3 +30,8 @@ def get_project_root() -> Path:
 
     # no __file__ (e.g. interactive shell); assume cwd is the project root
     return Path.cwd()
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse YAML using the libyaml C loader when available (safe subset only)."""
+    return yaml.load(stream, Loader=YamlLoader)
@@ -4,10 +4,10 @@ import os
 import re
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel
 
 from agentic_patterns.core.compliance.private_data import DataSensitivity
+from agentic_patterns.core.config.utils import load_yaml
 
 
 class ApiConnectionConfig(BaseModel):
@@ -61,7 +61,7 @@ class ApiConnectionConfigs:
         """Load API configurations from a YAML file with environment variable expansion."""
         if not yaml_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {yaml_path}")
-        data = yaml.safe_load(yaml_path.read_text())
+        data = load_yaml(yaml_path.read_text())
         if not data or "apis" not in data:
             raise ValueError("Invalid apis.yaml format: missing 'apis' key")
 
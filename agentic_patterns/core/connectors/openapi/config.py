@@ -2,10 +2,10 @@
 
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel
 
 from agentic_patterns.core.config.config import DATA_DIR, MAIN_PROJECT_DIR
+from agentic_patterns.core.config.utils import load_yaml
 
 
 class OpenApiConfig(BaseModel):
@@ -34,7 +34,7 @@ def load_openapi_config(config_path: Path | None = None) -> OpenApiConfig:
 
     if config_path.exists():
         with open(config_path) as f:
-            yaml_config = yaml.safe_load(f)
+            yaml_config = load_yaml(f)
             if yaml_config and "openapi" in yaml_config:
                 config = OpenApiConfig.model_validate(yaml_config["openapi"])
                 if config_path is None:
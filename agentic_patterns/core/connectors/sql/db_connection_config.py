@@ -2,10 +2,10 @@
 
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel, ConfigDict
 
 from agentic_patterns.core.compliance.private_data import DataSensitivity
+from agentic_patterns.core.config.utils import load_yaml
 from agentic_patterns.core.connectors.sql.database_type import DatabaseType
 
 
@@ -67,7 +67,7 @@ class DbConnectionConfigs:
         """Load database configurations from a YAML file."""
         if not yaml_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {yaml_path}")
-        data = yaml.safe_load(yaml_path.read_text())
+        data = load_yaml(yaml_path.read_text())
         if not data or "databases" not in data:
             raise ValueError("Invalid dbs.yaml format: missing 'databases' key")
         for db_id, db_data in data["databases"].items():
@@ -3,8 +3,7 @@
 import logging
 from pathlib import Path
 
-import yaml
-
+from agentic_patterns.core.config.utils import load_yaml
 from agentic_patterns.core.connectors.vocabulary.config import (
     VOCABULARIES_YAML_PATH,
     VOCABULARY_CACHE_DIR,
@@ -80,7 +79,7 @@ def _load_configs(config_path: Path | None = None) -> None:
     if not path.exists():
         return
     with open(path) as f:
-        data = yaml.safe_load(f) or {}
+        data = load_yaml(f) or {}
     vocabs = data.get("vocabularies", {})
     for name, entry in vocabs.items():
         _configs[name] = VocabularyConfig(name=name, **entry)
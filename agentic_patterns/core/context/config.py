@@ -5,10 +5,10 @@ Loads configuration from config.yaml for file processing limits, truncation sett
 
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel
 
 from agentic_patterns.core.config.config import MAIN_PROJECT_DIR
+from agentic_patterns.core.config.utils import load_yaml
 
 
 class TruncationConfig(BaseModel):
@@ -101,7 +101,7 @@ def load_context_config(config_path: Path | None = None) -> ContextConfig:
 
     if config_path.exists():
         with open(config_path) as f:
-            yaml_config = yaml.safe_load(f)
+            yaml_config = load_yaml(f)
             if yaml_config and "context" in yaml_config:
                 config = ContextConfig.model_validate(yaml_config["context"])
                 if config_path is None:
@@ -54,15 +54,26 @@ def load_module_from_file(file_path: Path) -> ModuleType:
     return module
 
 
+def _is_function(obj: Any) -> bool:
+    """Check if obj is a plain (sync or async) function."""
+    return inspect.isfunction(obj) or inspect.iscoroutinefunction(obj)
+
+
+def _by_name(items: list[tuple[str, Any]]) -> list[tuple[str, Any]]:
+    return sorted(items, key=lambda item: item[0])
+
+
 def _find_prefixed_objects(
     module: ModuleType, prefix: str, predicate: Callable[[Any], bool]
 ) -> list[tuple[str, Any]]:
     """Find all objects with a specific prefix matching a predicate."""
-    results = []
-    for name, obj in inspect.getmembers(module):
-        if name.startswith(prefix) and predicate(obj):
-            results.append((name, obj))
-    return results
+    return _by_name(
+        [
+            (name, obj)
+            for name, obj in vars(module).items()
+            if name.startswith(prefix) and predicate(obj)
+        ]
+    )
 
 
 def _find_datasets(module: ModuleType) -> list[tuple[str, Dataset]]:
@@ -74,20 +85,29 @@ def _find_datasets(module: ModuleType) -> list[tuple[str, Dataset]]:
 
 def _find_target_functions(module: ModuleType) -> list[tuple[str, Callable]]:
     """Find all target_* functions (sync or async)."""
-    return _find_prefixed_objects(
-        module,
-        "target_",
-        lambda obj: inspect.isfunction(obj) or inspect.iscoroutinefunction(obj),
-    )
+    return _find_prefixed_objects(module, "target_", _is_function)
 
 
 def _find_scorer_functions(module: ModuleType) -> list[tuple[str, Callable]]:
     """Find all scorer_* functions."""
-    return _find_prefixed_objects(
-        module,
-        "scorer_",
-        lambda obj: inspect.isfunction(obj) or inspect.iscoroutinefunction(obj),
-    )
+    return _find_prefixed_objects(module, "scorer_", _is_function)
+
+
+def _find_eval_objects(
+    module: ModuleType,
+) -> tuple[
+    list[tuple[str, Dataset]], list[tuple[str, Callable]], list[tuple[str, Callable]]
+]:
+    """Find datasets, target functions and scorer functions in a single pass."""
+    datasets, targets, scorers = [], [], []
+    for name, obj in vars(module).items():
+        if name.startswith("dataset_") and isinstance(obj, Dataset):
+            datasets.append((name, obj))
+        elif name.startswith("target_") and _is_function(obj):
+            targets.append((name, obj))
+        elif name.startswith("scorer_") and _is_function(obj):
+            scorers.append((name, obj))
+    return _by_name(datasets), _by_name(targets), _by_name(scorers)
 
 
 def _matches_filter(
@@ -96,13 +116,7 @@ def _matches_filter(
     """Check if the dataset matches the name filter."""
     if name_filter is None:
         return True
-    full_name = f"{module_name}.{dataset_name}"
-    return (
-        name_filter in module_name
-        or name_filter in file_name
-        or name_filter in dataset_name
-        or name_filter in full_name
-    )
+    return name_filter in file_name or name_filter in f"{module_name}.{dataset_name}"
 
 
 def discover_datasets(
@@ -126,9 +140,7 @@ def discover_datasets(
                 print(f"  Error loading {eval_file}: {e}")
             continue
 
-        datasets = _find_datasets(module)
-        targets = _find_target_functions(module)
-        scorers = _find_scorer_functions(module)
+        datasets, targets, scorers = _find_eval_objects(module)
 
         if verbose:
             print(
@@ -3,6 +3,7 @@ from agentic_patterns.core.feedback.feedback import (
     FeedbackType as FeedbackType,
     SessionFeedback as SessionFeedback,
     add_feedback as add_feedback,
+    append_session_history as append_session_history,
     get_feedback as get_feedback,
     load_session_history as load_session_history,
     save_session_history as save_session_history,
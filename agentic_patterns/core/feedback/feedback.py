@@ -2,7 +2,10 @@
 
 Stores feedback entries and conversation history as JSON files per session,
 following the same directory pattern as PrivateData:
-  FEEDBACK_DIR / user_id / session_id / {feedback.json, history.json}
+  FEEDBACK_DIR / user_id / session_id / {feedback.json, history.jsonl}
+
+Each line of history.jsonl holds a JSON array of messages; history.json is the
+legacy single-array format, still read when no history.jsonl exists.
 """
 
 import logging
@@ -19,7 +22,8 @@ from agentic_patterns.core.user_session import get_session_id, get_user_id
 logger = logging.getLogger(__name__)
 
 FEEDBACK_FILENAME = "feedback.json"
-HISTORY_FILENAME = "history.json"
+HISTORY_FILENAME = "history.jsonl"
+LEGACY_HISTORY_FILENAME = "history.json"
 
 
 class FeedbackType(str, Enum):
@@ -78,11 +82,20 @@ def get_feedback(
 def load_session_history(
     user_id: str | None = None, session_id: str | None = None
 ) -> list[ModelMessage]:
-    """Deserialize conversation history from history.json."""
-    path = _session_dir(user_id, session_id) / HISTORY_FILENAME
+    """Deserialize conversation history from history.jsonl (or legacy history.json)."""
+    session_dir = _session_dir(user_id, session_id)
+    path = session_dir / HISTORY_FILENAME
     if not path.exists():
+        legacy_path = session_dir / LEGACY_HISTORY_FILENAME
+        if legacy_path.exists():
+            return ModelMessagesTypeAdapter.validate_json(legacy_path.read_bytes())
         return []
-    return ModelMessagesTypeAdapter.validate_json(path.read_bytes())
+    messages: list[ModelMessage] = []
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                messages.extend(ModelMessagesTypeAdapter.validate_json(line))
+    return messages
 
 
 def save_session_history(
@@ -90,7 +103,30 @@ def save_session_history(
     user_id: str | None = None,
     session_id: str | None = None,
 ) -> None:
-    """Serialize conversation history to history.json."""
-    path = _session_dir(user_id, session_id) / HISTORY_FILENAME
+    """Serialize the full conversation history to history.jsonl, replacing it."""
+    session_dir = _session_dir(user_id, session_id)
+    session_dir.mkdir(parents=True, exist_ok=True)
+    (session_dir / HISTORY_FILENAME).write_bytes(
+        ModelMessagesTypeAdapter.dump_json(messages) + b"\n"
+    )
+    (session_dir / LEGACY_HISTORY_FILENAME).unlink(missing_ok=True)
+
+
+def append_session_history(
+    new_messages: list[ModelMessage],
+    user_id: str | None = None,
+    session_id: str | None = None,
+) -> None:
+    """Append one turn's new messages (e.g. result.new_messages()) to history.jsonl."""
+    if not new_messages:
+        return
+    session_dir = _session_dir(user_id, session_id)
+    path = session_dir / HISTORY_FILENAME
+    if not path.exists() and (session_dir / LEGACY_HISTORY_FILENAME).exists():
+        # Migrate the legacy file first, so its turns are kept
+        save_session_history(
+            load_session_history(user_id, session_id), user_id, session_id
+        )
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(ModelMessagesTypeAdapter.dump_json(messages, indent=2))
+    with open(path, "ab") as f:
+        f.write(ModelMessagesTypeAdapter.dump_json(new_messages) + b"\n")
@@ -2,6 +2,7 @@ from agentic_patterns.core.mcp.config import (
     MCPClientConfig as MCPClientConfig,
     MCPServerConfig as MCPServerConfig,
     MCPSettings as MCPSettings,
+    clear_mcp_settings_cache as clear_mcp_settings_cache,
     load_mcp_settings as load_mcp_settings,
 )
 from agentic_patterns.core.mcp.errors import (
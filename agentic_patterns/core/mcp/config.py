@@ -2,19 +2,25 @@
 
 import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Annotated, Literal
 
-import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from agentic_patterns.core.config.config import MAIN_PROJECT_DIR
+from agentic_patterns.core.config.utils import load_yaml
 
 
 class MCPClientConfig(BaseModel):
     """Configuration for connecting to an external MCP server."""
 
+    # Frozen: cached instances are shared by every load_mcp_settings() caller
+    model_config = ConfigDict(frozen=True)
+
     name: str = ""
-    type: str = Field(default="client")
+    type: Literal["client"] = Field(default="client")
     url: str
     url_isolated: str | None = None
     read_timeout: int = Field(default=60)
@@ -23,13 +29,17 @@ class MCPClientConfig(BaseModel):
 class MCPServerConfig(BaseModel):
     """Configuration for exposing an MCP server."""
 
-    type: str = Field(default="server")
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["server"] = Field(default="server")
     name: str
     instructions: str | None = None
     port: int = Field(default=8000)
 
 
-MCPConfig = MCPClientConfig | MCPServerConfig
+MCPConfig = Annotated[MCPClientConfig | MCPServerConfig, Field(discriminator="type")]
+
+_MCP_CONFIG_ADAPTER: TypeAdapter[MCPConfig] = TypeAdapter(MCPConfig)
 
 
 class MCPSettings(BaseModel):
@@ -45,54 +55,82 @@ class MCPSettings(BaseModel):
         return self.mcp_servers[name]
 
 
+INTERN_MAX_LEN = 32
+
+_ENV_VAR_RE = re.compile(r"\$\{(\w+)\}")
+
+
+def _replace_env_var(match: re.Match) -> str:
+    return os.environ.get(match.group(1), match.group(0))
+
+
 def _expand_env_vars(value: str) -> str:
     """Expand ${VAR} patterns in string values."""
-    pattern = r"\$\{(\w+)\}"
+    if "${" not in value:
+        return value
+    return _ENV_VAR_RE.sub(_replace_env_var, value)
 
-    def replace(match):
-        var_name = match.group(1)
-        return os.environ.get(var_name, match.group(0))
 
-    return re.sub(pattern, replace, value)
+def _intern_short(value: str) -> str:
+    """Intern short strings (types, names, repeated hosts) shared across entries."""
+    return sys.intern(value) if len(value) < INTERN_MAX_LEN else value
 
 
-def _expand_config_vars(config: dict) -> dict:
-    """Recursively expand environment variables in config dict."""
-    result = {}
-    for key, value in config.items():
-        if isinstance(value, str):
-            result[key] = _expand_env_vars(value)
-        elif isinstance(value, dict):
-            result[key] = _expand_config_vars(value)
-        else:
-            result[key] = value
-    return result
+def _build_mcp_settings(data: dict) -> MCPSettings:
+    """Build MCPSettings from parsed YAML, validating every entry."""
+    mcp_servers: dict[str, MCPConfig] = {}
+
+    if "mcp_servers" in data:
+        for name, config_data in data["mcp_servers"].items():
+            # MCP entries are flat, so expansion is a single pass over the leaves
+            config_data = {
+                sys.intern(k): _intern_short(_expand_env_vars(v))
+                if isinstance(v, str)
+                else v
+                for k, v in config_data.items()
+            }
+            config_type = config_data.setdefault("type", "client")
+            if config_type == "client":
+                config_data["name"] = name
+            # Dispatches on the "type" discriminator; unknown types fail validation
+            mcp_servers[name] = _MCP_CONFIG_ADAPTER.validate_python(config_data)
+
+    return MCPSettings.model_construct(mcp_servers=mcp_servers)
+
+
+@lru_cache(maxsize=8)
+def _read_config(config_path: str, mtime_ns: int) -> tuple[dict, tuple[str, ...]]:
+    """Parsed YAML and the ${VAR} names it references, from one read of the file."""
+    text = Path(config_path).read_text()
+    return load_yaml(text), tuple(sorted(set(_ENV_VAR_RE.findall(text))))
+
+
+@lru_cache(maxsize=8)
+def _load_mcp_settings_cached(
+    config_path: str, mtime_ns: int, env: tuple[tuple[str, str | None], ...]
+) -> MCPSettings:
+    """Validate MCPSettings; cached per (path, mtime, referenced env)."""
+    data, _ = _read_config(config_path, mtime_ns)
+    return _build_mcp_settings(data)
 
 
 def load_mcp_settings(config_path: Path | str | None = None) -> MCPSettings:
-    """Load MCP configurations from YAML file."""
+    """Load MCP settings from YAML, cached per path, mtime and referenced env vars."""
     if config_path is None:
         config_path = MAIN_PROJECT_DIR / "config.yaml"
 
-    config_path = Path(config_path)
+    config_path = Path(config_path).resolve()
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path) as f:
-        data = yaml.safe_load(f)
+    path_str, mtime_ns = str(config_path), config_path.stat().st_mtime_ns
+    _, env_var_names = _read_config(path_str, mtime_ns)
+    env = tuple((name, os.environ.get(name)) for name in env_var_names)
+    cached = _load_mcp_settings_cached(path_str, mtime_ns, env)
+    return cached.model_copy(update={"mcp_servers": dict(cached.mcp_servers)})
 
-    mcp_servers: dict[str, MCPConfig] = {}
 
-    if "mcp_servers" in data:
-        for name, config_data in data["mcp_servers"].items():
-            config_data = _expand_config_vars(config_data)
-            config_type = config_data.get("type", "client")
-            match config_type:
-                case "client":
-                    mcp_servers[name] = MCPClientConfig(name=name, **config_data)
-                case "server":
-                    mcp_servers[name] = MCPServerConfig(**config_data)
-                case _:
-                    raise ValueError(f"Unsupported MCP type: {config_type}")
-
-    return MCPSettings(mcp_servers=mcp_servers)
+def clear_mcp_settings_cache() -> None:
+    """Drop cached MCP settings, so the next load re-reads the config file."""
+    _read_config.cache_clear()
+    _load_mcp_settings_cached.cache_clear()
@@ -38,6 +38,29 @@ def create_process_tool_call(get_token: Callable[[], str | None]):
     return process_tool_call
 
 
+def _auth_headers(bearer_token: str | None) -> dict[str, str] | None:
+    return {"Authorization": f"Bearer {bearer_token}"} if bearer_token else None
+
+
+def _build_mcp_client(
+    name: str, config: MCPClientConfig | MCPServerConfig, common: dict[str, Any]
+) -> MCPServerStrict | MCPServerPrivateData:
+    """Create the MCP server toolset for an already-loaded config entry."""
+    if config.type != "client":
+        raise ValueError(
+            f"MCP config '{name}' is not a client config (type={config.type})"
+        )
+
+    if config.url_isolated:
+        return MCPServerPrivateData(
+            url=config.url,
+            url_isolated=config.url_isolated,
+            timeout=config.read_timeout,
+            **common,
+        )
+    return MCPServerStrict(url=config.url, timeout=config.read_timeout, **common)
+
+
 def get_mcp_client(
     name: str, config_path: Path | str | None = None, bearer_token: str | None = None
 ) -> MCPServerStrict | MCPServerPrivateData:
@@ -47,31 +70,39 @@ def get_mcp_client(
     MCPServerStrict otherwise.
     """
     settings = load_mcp_settings(config_path)
-    config = settings.get(name)
-
-    if not isinstance(config, MCPClientConfig):
-        raise ValueError(
-            f"MCP config '{name}' is not a client config (type={config.type})"
-        )
-
-    headers = {"Authorization": f"Bearer {bearer_token}"} if bearer_token else None
     common: dict[str, Any] = dict(
-        timeout=config.read_timeout,
-        headers=headers,
-        log_handler=default_mcp_log_handler,
+        headers=_auth_headers(bearer_token), log_handler=default_mcp_log_handler
     )
-    if config.url_isolated:
-        return MCPServerPrivateData(
-            url=config.url, url_isolated=config.url_isolated, **common
-        )
-    return MCPServerStrict(url=config.url, **common)
+    return _build_mcp_client(name, settings.get(name), common)
 
 
 def get_mcp_clients(
-    names: list[str], config_path: Path | str | None = None
+    names: list[str],
+    config_path: Path | str | None = None,
+    bearer_token: str | list[str | None] | None = None,
 ) -> list[MCPServerStrict | MCPServerPrivateData]:
-    """Create multiple MCP server toolsets from config.yaml."""
-    return [get_mcp_client(name, config_path) for name in names]
+    """Create multiple MCP server toolsets from config.yaml.
+
+    `bearer_token` is either one token for all clients or a list with one per name.
+    """
+    settings = load_mcp_settings(config_path)
+    if isinstance(bearer_token, list):
+        if len(bearer_token) != len(names):
+            raise ValueError(
+                f"Expected {len(names)} bearer tokens, got {len(bearer_token)}"
+            )
+        return [
+            _build_mcp_client(
+                name,
+                settings.get(name),
+                dict(headers=_auth_headers(token), log_handler=default_mcp_log_handler),
+            )
+            for name, token in zip(names, bearer_token)
+        ]
+    common: dict[str, Any] = dict(
+        headers=_auth_headers(bearer_token), log_handler=default_mcp_log_handler
+    )
+    return [_build_mcp_client(name, settings.get(name), common) for name in names]
 
 
 def get_mcp_server(name: str, config_path: Path | str | None = None) -> FastMCP:
@@ -79,7 +110,7 @@ def get_mcp_server(name: str, config_path: Path | str | None = None) -> FastMCP:
     settings = load_mcp_settings(config_path)
     config = settings.get(name)
 
-    if not isinstance(config, MCPServerConfig):
+    if config.type != "server":
         raise ValueError(
             f"MCP config '{name}' is not a server config (type={config.type})"
         )
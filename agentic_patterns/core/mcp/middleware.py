@@ -12,8 +12,9 @@ class AuthSessionMiddleware(Middleware):
 
     async def on_request(self, context, call_next):
         token = get_access_token()
-        if token:
+        if token is not None:
+            claims = token.claims
             set_user_session(
-                token.claims["sub"], token.claims.get("session_id", DEFAULT_SESSION_ID)
+                claims["sub"], claims.get("session_id", DEFAULT_SESSION_ID)
             )
         return await call_next(context)
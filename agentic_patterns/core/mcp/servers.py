@@ -1,5 +1,6 @@
 """MCP server toolsets: strict error handling and private-data isolation."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -12,7 +13,6 @@ from agentic_patterns.core.mcp.errors import FATAL_PREFIX
 
 logger = logging.getLogger(__name__)
 
-
 MCP_LOG_LEVEL_MAP: dict[str, int] = {
     "debug": logging.DEBUG,
     "info": logging.INFO,
@@ -23,17 +23,19 @@ MCP_LOG_LEVEL_MAP: dict[str, int] = {
     "alert": logging.CRITICAL,
     "emergency": logging.CRITICAL,
 }
+_get_log_level = MCP_LOG_LEVEL_MAP.get
 
 
 async def default_mcp_log_handler(
     params: mcp_types.LoggingMessageNotificationParams,
 ) -> None:
     """Forward MCP server log messages to Python logging."""
+    level = _get_log_level(params.level, logging.INFO)
+    if not logger.isEnabledFor(level):
+        return
     data = params.data
     msg = data.get("msg", str(data)) if isinstance(data, dict) else str(data)
-    name = params.logger or "mcp"
-    level = MCP_LOG_LEVEL_MAP.get(params.level, logging.INFO)
-    logger.log(level, "[%s] %s", name, msg)
+    logger.log(level, "[%s] %s", params.logger or "mcp", msg)
 
 
 class MCPServerStrict(MCPServerStreamableHTTP):
@@ -50,7 +52,7 @@ class MCPServerStrict(MCPServerStreamableHTTP):
         try:
             return await super().direct_call_tool(name, args, metadata)
         except ModelRetry as e:
-            msg = str(e)
+            msg = e.message
             if msg.startswith(FATAL_PREFIX):
                 raise RuntimeError(msg[len(FATAL_PREFIX) :]) from e
             raise
@@ -59,10 +61,18 @@ class MCPServerStrict(MCPServerStreamableHTTP):
 class MCPServerPrivateData(MCPServerStrict):
     """Dual-instance MCP server toolset for private-data-aware network isolation.
 
-    Holds two MCPServerStrict instances -- normal and isolated --
-    both opened at context entry. Every call delegates through _target(), which
-    checks session_has_private_data(). Once private data appears, all subsequent
-    calls route to the isolated instance. The switch is a one-way ratchet.
+    Holds two MCPServerStrict instances -- normal and isolated. Only the normal
+    instance is opened at context entry; the isolated one is opened on first use,
+    so sessions without private data never connect to it.
+
+    Every call resolves its target once, through _target(), which checks
+    session_has_private_data() for that call (a negative answer is never reused).
+    Once private data appears, all subsequent calls route to the isolated instance.
+    The switch is a one-way ratchet: _target is rebound to a function returning the
+    isolated instance, so later calls skip the check entirely.
+
+    list_tools results are cached per isolation state; the cache is dropped on
+    the switch. get_tools is not cached: it is built per run context.
     """
 
     def __init__(self, url: str, url_isolated: str, **kwargs):
@@ -70,37 +80,73 @@ class MCPServerPrivateData(MCPServerStrict):
         self._normal = MCPServerStrict(url=url, **kwargs)
         self._isolated = MCPServerStrict(url=url_isolated, **kwargs)
         self._is_isolated = False
+        self._target = self._check_target
+        self._list_tools_cache: dict[bool, Any] = {}
+        self._enter_count = 0
+        self._isolated_entered = False
+        self._isolated_lock = asyncio.Lock()
 
     @property
     def is_isolated(self) -> bool:
         return self._is_isolated
 
-    def _target(self) -> MCPServerStrict:
-        if not self._is_isolated:
-            self._is_isolated = session_has_private_data()
-            if self._is_isolated:
-                logger.info("Private data detected -- switching to isolated instance")
-        return self._isolated if self._is_isolated else self._normal
+    def _check_target(self) -> MCPServerStrict:
+        # A negative answer is never reused: another tool may mark the session
+        # private between two calls of the same agent step
+        if not session_has_private_data():
+            return self._normal
+        logger.info("Private data detected -- switching to isolated instance")
+        self._is_isolated = True
+        self._list_tools_cache.clear()
+        isolated = self._isolated
+        self._target = lambda: isolated
+        return isolated
+
+    async def _resolve_target(self) -> MCPServerStrict:
+        """Return the current target, opening the isolated instance on first use."""
+        target = self._target()
+        if (
+            target is self._isolated
+            and self._enter_count
+            and not self._isolated_entered
+        ):
+            async with self._isolated_lock:
+                if not self._isolated_entered:
+                    await self._isolated.__aenter__()
+                    self._isolated_entered = True
+        return target
 
     async def __aenter__(self):
         await self._normal.__aenter__()
-        await self._isolated.__aenter__()
+        self._enter_count += 1
         return self
 
     async def __aexit__(self, *args):
-        await self._isolated.__aexit__(*args)
-        await self._normal.__aexit__(*args)
+        self._enter_count -= 1
+        try:
+            if self._enter_count == 0 and self._isolated_entered:
+                self._isolated_entered = False
+                await self._isolated.__aexit__(*args)
+        finally:
+            await self._normal.__aexit__(*args)
 
     async def call_tool(self, name, tool_args, ctx, tool):
-        return await self._target().call_tool(name, tool_args, ctx, tool)
+        target = await self._resolve_target()
+        return await target.call_tool(name, tool_args, ctx, tool)
 
     async def direct_call_tool(
         self, name: str, args: dict[str, Any], metadata: dict[str, Any] | None = None
     ):
-        return await self._target().direct_call_tool(name, args, metadata)
+        target = await self._resolve_target()
+        return await target.direct_call_tool(name, args, metadata)
 
     async def get_tools(self, ctx):
-        return await self._target().get_tools(ctx)
+        target = await self._resolve_target()
+        return await target.get_tools(ctx)
 
     async def list_tools(self):
-        return await self._target().list_tools()
+        target = await self._resolve_target()
+        key = self._is_isolated
+        if key not in self._list_tools_cache:
+            self._list_tools_cache[key] = await target.list_tools()
+        return self._list_tools_cache[key]
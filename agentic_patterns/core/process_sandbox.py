@@ -58,6 +58,7 @@ class Sandbox(ABC):
         isolate_pid: bool = True,
         cwd: str | None = None,
         env: dict[str, str] | None = None,
+        stdin: bytes | None = None,
     ) -> SandboxResult:
         """Run a command in the sandbox.
 
@@ -69,6 +70,7 @@ class Sandbox(ABC):
             isolate_pid: Isolate PID namespace
             cwd: Working directory inside the sandbox
             env: Environment variables (None = inherit)
+            stdin: Bytes fed to the command's standard input (None = no input)
         """
 
 
@@ -85,6 +87,7 @@ class SandboxBubblewrap(Sandbox):
         isolate_pid: bool = True,
         cwd: str | None = None,
         env: dict[str, str] | None = None,
+        stdin: bytes | None = None,
     ) -> SandboxResult:
         cmd = self._build_command(
             command, bind_mounts or [], isolate_network, isolate_pid, cwd
@@ -93,6 +96,7 @@ class SandboxBubblewrap(Sandbox):
 
         process = await asyncio.create_subprocess_exec(
             *cmd,
+            stdin=asyncio.subprocess.PIPE if stdin is not None else None,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             env=env,
@@ -100,7 +104,7 @@ class SandboxBubblewrap(Sandbox):
 
         try:
             stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=timeout
+                process.communicate(stdin), timeout=timeout
             )
             return SandboxResult(
                 exit_code=process.returncode or 0, stdout=stdout, stderr=stderr
@@ -2,6 +2,7 @@
 
 import re
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 from agentic_patterns.core.config.config import PROMPTS_DIR
@@ -10,31 +11,89 @@ from agentic_patterns.core.config.config import PROMPTS_DIR
 logger = logging.getLogger(__name__)
 
 
-def _resolve_includes(text: str, base_dir: Path) -> str:
-    """Resolve {% include 'path.md' %} directives relative to PROMPTS_DIR."""
-    include_re = re.compile(r"\{%\s*include\s+['\"](.+?)['\"]\s*%\}")
-    while True:
-        match = include_re.search(text)
-        if not match:
-            break
+@lru_cache(maxsize=128)
+def _read_prompt_file(path: str, mtime_ns: int) -> str:
+    """Read a prompt file; cached per (path, mtime) so edits are picked up."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _read_prompt(path: Path) -> str:
+    return _read_prompt_file(str(path), path.stat().st_mtime_ns)
+
+
+_INCLUDE_RE = re.compile(r"\{%\s*include\s+['\"](.+?)['\"]\s*%\}")
+_VARIABLE_RE = re.compile(r"\{([a-zA-Z_][a-zA-Z0-9_]*)\}")
+
+
+def _resolve_includes(
+    text: str, base_dir: Path, included_paths: list[Path] | None = None
+) -> str:
+    """Resolve {% include 'path.md' %} directives, appending each included file to included_paths."""
+
+    def replace(match: re.Match) -> str:
         include_path = PROMPTS_DIR / match.group(1)
         if not include_path.exists():
             raise FileNotFoundError(f"Include file not found: {include_path}")
-        included = include_path.read_text(encoding="utf-8")
-        text = text[: match.start()] + included + text[match.end() :]
+        if included_paths is not None:
+            included_paths.append(include_path)
+        return _read_prompt(include_path)
+
+    while "{%" in text:
+        text, count = _INCLUDE_RE.subn(replace, text)
+        if count == 0:
+            break
     return text
 
 
+PROMPT_CACHE_SIZE = 128
+
+# (prompt_path, kwargs) -> (((file, mtime_ns), ...), rendered prompt)
+_prompt_cache: dict[tuple, tuple[tuple[tuple[Path, int], ...], str]] = {}
+
+
+def _is_fresh(files: tuple[tuple[Path, int], ...]) -> bool:
+    try:
+        return all(path.stat().st_mtime_ns == mtime_ns for path, mtime_ns in files)
+    except OSError:
+        return False
+
+
 def load_prompt(prompt_path: Path, **kwargs) -> str:
     """Load a prompt file, resolve includes, and substitute variables.
 
     Supports {% include 'relative/path.md' %} directives resolved relative to PROMPTS_DIR.
+    Rendered prompts are memoized per (path, kwargs) and reused while the prompt file
+    and all its includes keep the same mtime (kwargs must be hashable to be cached).
     """
-    template = prompt_path.read_text(encoding="utf-8")
-    template = _resolve_includes(template, prompt_path.parent)
+    try:
+        key = (prompt_path, frozenset(kwargs.items()))
+        hash(key)
+    except TypeError:
+        return _render_prompt(prompt_path, kwargs, [])
+
+    cached = _prompt_cache.get(key)
+    if cached is not None and _is_fresh(cached[0]):
+        return cached[1]
+
+    files = [prompt_path]
+    result = _render_prompt(prompt_path, kwargs, files)
+    _prompt_cache.pop(key, None)
+    _prompt_cache[key] = (tuple((f, f.stat().st_mtime_ns) for f in files), result)
+    if len(_prompt_cache) > PROMPT_CACHE_SIZE:
+        del _prompt_cache[next(iter(_prompt_cache))]
+    return result
+
+
+def _render_prompt(prompt_path: Path, kwargs: dict, files: list[Path]) -> str:
+    """Read, resolve includes, check variables and format; included files go to `files`."""
+    template = _read_prompt(prompt_path)
+    template = _resolve_includes(template, prompt_path.parent, files)
 
     # Extract all variables from the template using regex
-    template_vars = set(re.findall(r"\{([a-zA-Z_][a-zA-Z0-9_]*)\}", template))
+    if "{" in template:
+        template_vars = set(_VARIABLE_RE.findall(template))
+    else:
+        template_vars = set()
     provided_vars = set(kwargs.keys())
 
     # Check for missing variables
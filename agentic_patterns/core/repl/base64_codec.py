@@ -0,0 +1,33 @@
+"""Base64 helpers for image payloads.
+
+Uses pybase64 (SIMD-accelerated, runtime CPU dispatch) when it is installed,
+otherwise the stdlib binascii codec, skipping the base64 module's wrappers.
+"""
+
+import binascii
+
+try:
+    import pybase64
+except ImportError:  # optional accelerator
+    pybase64 = None
+
+
+def b64encode_str(data: bytes) -> str:
+    """Encode bytes as a base64 str."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def b64decode(data: str | bytes, validate: bool = False) -> bytes:
+    """Decode base64 data.
+
+    By default non-alphabet characters are discarded without a check (as in
+    base64.b64decode), the fast path for trusted input such as our own
+    notebooks. With validate=True malformed input raises binascii.Error.
+    """
+    if pybase64 is not None:
+        return pybase64.b64decode(data, validate=validate)
+    if isinstance(data, str):
+        data = data.encode("ascii")
+    return binascii.a2b_base64(data, strict_mode=validate)
@@ -1,6 +1,5 @@
 """Cell model: represents a single executable cell in a notebook."""
 
-import asyncio
 import logging
 import uuid
 from datetime import datetime
@@ -18,6 +17,10 @@ from agentic_patterns.core.repl.image import Image
 logger = logging.getLogger(__name__)
 
 
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
 class Cell(BaseModel):
     """Model representing a notebook cell."""
 
@@ -65,8 +68,7 @@ class Cell(BaseModel):
 
         start_time = datetime.now()
 
-        await asyncio.to_thread(
-            self._execute_sync,
+        await self._execute(
             namespace,
             timeout,
             import_statements or [],
@@ -80,7 +82,7 @@ class Cell(BaseModel):
             "Cell %s execution completed in %.2f seconds", self.id, self.execution_time
         )
 
-    def _execute_sync(
+    async def _execute(
         self,
         namespace: dict[str, Any],
         timeout: int,
@@ -89,7 +91,7 @@ class Cell(BaseModel):
         user_id: str,
         session_id: str,
     ) -> None:
-        """Execute the cell synchronously via sandbox."""
+        """Execute the cell via sandbox on the caller's event loop."""
         import types
 
         from agentic_patterns.core.config.config import WORKSPACE_DIR
@@ -98,27 +100,27 @@ class Cell(BaseModel):
         workspace_path: Path = WORKSPACE_DIR / user_id / session_id
         workspace_path.mkdir(parents=True, exist_ok=True)
 
-        clean_namespace = {
-            k: v for k, v in namespace.items() if not isinstance(v, types.ModuleType)
-        }
-
-        loop = asyncio.new_event_loop()
-        try:
-            result: SubprocessResult = loop.run_until_complete(
-                execute_in_sandbox(
-                    code=self.code,
-                    namespace=clean_namespace,
-                    import_statements=import_statements,
-                    function_definitions=function_definitions,
-                    timeout=timeout,
-                    user_id=user_id,
-                    session_id=session_id,
-                    workspace_path=workspace_path,
-                    cell_id=self.id,
-                )
-            )
-        finally:
-            loop.close()
+        # Namespaces returned by the executor never contain modules, so the
+        # filtered copy is only needed for namespaces seeded by the caller
+        clean_namespace = namespace
+        if any(isinstance(v, types.ModuleType) for v in namespace.values()):
+            clean_namespace = {
+                k: v
+                for k, v in namespace.items()
+                if not isinstance(v, types.ModuleType)
+            }
+
+        result: SubprocessResult = await execute_in_sandbox(
+            code=self.code,
+            namespace=clean_namespace,
+            import_statements=import_statements,
+            function_definitions=function_definitions,
+            timeout=timeout,
+            user_id=user_id,
+            session_id=session_id,
+            workspace_path=workspace_path,
+            cell_id=self.id,
+        )
 
         self.state = result.state
         self.outputs = result.outputs
@@ -138,15 +140,21 @@ class Cell(BaseModel):
                 saved_resources.append(file_path)
         return saved_resources
 
+    def _base_dict(self) -> dict:
+        """Fields shared by serialize() and to_ipynb(), timestamps formatted once."""
+        return {
+            "state": self.state.value,
+            "created_at": _isoformat(self.created_at),
+            "executed_at": _isoformat(self.executed_at),
+            "execution_time": self.execution_time,
+        }
+
     def serialize(self) -> dict:
         result = {
             "id": self.id,
             "code": self.code,
-            "state": self.state.value,
             "execution_count": self.execution_count,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "executed_at": self.executed_at.isoformat() if self.executed_at else None,
-            "execution_time": self.execution_time,
+            **self._base_dict(),
             "number": self.cell_number,
         }
         if self.outputs:
@@ -155,31 +163,17 @@ class Cell(BaseModel):
 
     def to_ipynb(self) -> dict:
         """Convert the cell to Jupyter notebook cell format."""
-        ipynb_cell = {
+        outputs = [output.to_ipynb() for output in self.outputs]
+        return {
             "cell_type": "code",
             "execution_count": self.execution_count,
             "id": self.id,
             "metadata": {
-                "mcp_repl": {
-                    "cell_number": self.cell_number,
-                    "state": self.state.value,
-                    "created_at": self.created_at.isoformat()
-                    if self.created_at
-                    else None,
-                    "executed_at": self.executed_at.isoformat()
-                    if self.executed_at
-                    else None,
-                    "execution_time": self.execution_time,
-                }
+                "mcp_repl": {"cell_number": self.cell_number, **self._base_dict()}
             },
             "source": self.code.split("\n"),
-            "outputs": [],
+            "outputs": [output for output in outputs if output],
         }
-        for output in self.outputs:
-            ipynb_output = output.to_ipynb()
-            if ipynb_output:
-                ipynb_cell["outputs"].append(ipynb_output)
-        return ipynb_cell
 
     @classmethod
     def unserialize(cls, data: dict) -> "Cell":
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from datetime import datetime
 
 import matplotlib.pyplot as plt
@@ -6,6 +7,8 @@ from pydantic import BaseModel, Field
 from agentic_patterns.core.repl.enums import OutputType
 from agentic_patterns.core.repl.image import Image, ImageReference
 
+_IMAGE_TYPES = (Image, ImageReference)
+
 
 class CellOutput(BaseModel):
     """Model for cell execution output."""
@@ -17,7 +20,7 @@ class CellOutput(BaseModel):
     def __str__(self) -> str:
         time_str = self.timestamp.strftime("%H:%M:%S")
         if self.output_type == OutputType.IMAGE:
-            if isinstance(self.content, Image | ImageReference):
+            if isinstance(self.content, _IMAGE_TYPES):
                 content_preview = str(self.content)
             else:
                 content_preview = "[Base64 encoded image]"
@@ -38,7 +41,7 @@ class CellOutput(BaseModel):
             "timestamp": self.timestamp.isoformat(),
         }
         if self.output_type == OutputType.IMAGE and isinstance(
-            self.content, Image | ImageReference
+            self.content, _IMAGE_TYPES
         ):
             if isinstance(self.content, Image):
                 result["content_type"] = "image"
@@ -86,51 +89,57 @@ class CellOutput(BaseModel):
 
     def to_ipynb(self) -> dict | None:
         """Convert the cell output to Jupyter notebook output format."""
-        match self.output_type:
-            case OutputType.TEXT:
-                return {
-                    "output_type": "stream",
-                    "name": "stdout",
-                    "text": str(self.content).split("\n"),
-                }
-            case OutputType.ERROR:
-                return {
-                    "output_type": "error",
-                    "ename": "Error",
-                    "evalue": str(self.content),
-                    "traceback": str(self.content).split("\n"),
-                }
-            case OutputType.HTML:
-                return {
-                    "output_type": "display_data",
-                    "data": {"text/html": self.content},
-                    "metadata": {},
-                }
-            case OutputType.IMAGE if isinstance(self.content, Image):
-                mime_type = f"image/{self.content.format}"
-                return {
-                    "output_type": "display_data",
-                    "data": {mime_type: self.content.get_data_base64()},
-                    "metadata": {
-                        mime_type: {
-                            "width": self.content.width,
-                            "height": self.content.height,
-                        }
-                    },
-                }
-            case OutputType.IMAGE if isinstance(self.content, ImageReference):
-                return {
-                    "output_type": "display_data",
-                    "data": {
-                        "text/plain": f"Image Reference: {self.content.resource_uri}"
-                    },
-                    "metadata": {},
-                }
-            case OutputType.DATAFRAME:
-                return {
-                    "output_type": "display_data",
-                    "data": {"text/html": self.content},
-                    "metadata": {},
-                }
-            case _:
-                return None
+        handler = _IPYNB_HANDLERS.get(self.output_type)
+        return handler(self) if handler else None
+
+
+def _text_to_ipynb(output: CellOutput) -> dict:
+    return {
+        "output_type": "stream",
+        "name": "stdout",
+        "text": str(output.content).split("\n"),
+    }
+
+
+def _error_to_ipynb(output: CellOutput) -> dict:
+    return {
+        "output_type": "error",
+        "ename": "Error",
+        "evalue": str(output.content),
+        "traceback": str(output.content).split("\n"),
+    }
+
+
+def _html_to_ipynb(output: CellOutput) -> dict:
+    return {
+        "output_type": "display_data",
+        "data": {"text/html": output.content},
+        "metadata": {},
+    }
+
+
+def _image_to_ipynb(output: CellOutput) -> dict | None:
+    content = output.content
+    if isinstance(content, Image):
+        mime_type = f"image/{content.format}"
+        return {
+            "output_type": "display_data",
+            "data": {mime_type: content.get_data_base64()},
+            "metadata": {mime_type: {"width": content.width, "height": content.height}},
+        }
+    if isinstance(content, ImageReference):
+        return {
+            "output_type": "display_data",
+            "data": {"text/plain": f"Image Reference: {content.resource_uri}"},
+            "metadata": {},
+        }
+    return None
+
+
+_IPYNB_HANDLERS: dict[OutputType, Callable[[CellOutput], dict | None]] = {
+    OutputType.TEXT: _text_to_ipynb,
+    OutputType.ERROR: _error_to_ipynb,
+    OutputType.HTML: _html_to_ipynb,
+    OutputType.IMAGE: _image_to_ipynb,
+    OutputType.DATAFRAME: _html_to_ipynb,
+}
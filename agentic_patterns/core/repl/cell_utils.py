@@ -2,15 +2,16 @@
 
 import ast
 import builtins
+import os
 import pickle
-import shutil
 import types
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 from agentic_patterns.core.repl.cell_output import CellOutput
+from agentic_patterns.core.repl.config import PICKLE_PROTOCOL
 from agentic_patterns.core.repl.enums import CellState
 from agentic_patterns.core.repl.openpyxl_handler import filter_openpyxl_from_namespace
 
@@ -18,13 +19,28 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_BUILTIN_FUNCTION_NAMES: frozenset[str] = frozenset(
+    name
+    for name in dir(builtins)
+    if isinstance(getattr(builtins, name, None), types.BuiltinFunctionType)
+)
+
+# Exact types that always pickle; subclasses may carry unpicklable state
+_TRIVIALLY_PICKLABLE: frozenset[type] = frozenset(
+    {int, float, complex, str, bool, bytes, type(None)}
+)
+
+REMOVE_TREE_PARALLEL_MIN_FILES = 64
+REMOVE_TREE_MAX_WORKERS = 8
 
-class SubprocessResult(BaseModel):
+
+@dataclass(slots=True)
+class SubprocessResult:
     """Result of cell execution in a subprocess."""
 
     state: CellState = CellState.COMPLETED
-    outputs: list[CellOutput] = Field(default_factory=list)
-    namespace: dict[str, Any] = Field(default_factory=dict)
+    outputs: list[CellOutput] = field(default_factory=list)
+    namespace: dict[str, Any] = field(default_factory=dict)
 
 
 def cleanup_temp_workbooks(user_id: str, session_id: str) -> None:
@@ -34,7 +50,7 @@ def cleanup_temp_workbooks(user_id: str, session_id: str) -> None:
     temp_dir = get_repl_data_dir(user_id, session_id) / ".temp"
     if temp_dir.exists():
         try:
-            shutil.rmtree(temp_dir)
+            remove_tree(temp_dir)
             logger.info("Cleaned up temporary workbooks in %s", temp_dir)
         except Exception as e:
             logger.exception(
@@ -42,40 +58,69 @@ def cleanup_temp_workbooks(user_id: str, session_id: str) -> None:
             )
 
 
+def remove_tree(path: Path | str) -> None:
+    """Recursively delete a directory; symlinks are unlinked, never followed."""
+    files: list[str] = []
+    dirs: list[str] = []
+    pending = [os.fspath(path)]
+    while pending:
+        current = pending.pop()
+        dirs.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    files.append(entry.path)
+
+    if len(files) >= REMOVE_TREE_PARALLEL_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=REMOVE_TREE_MAX_WORKERS) as executor:
+            list(executor.map(_unlink, files))
+    else:
+        for file_path in files:
+            _unlink(file_path)
+    # A directory is always listed after its parent
+    for dir_path in reversed(dirs):
+        os.rmdir(dir_path)
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
 def execute_and_capture_last_expression(code: str, namespace: dict[str, Any]) -> Any:
     """Execute code and capture the value of the last expression if present."""
     try:
         parsed_ast = ast.parse(code)
-        if parsed_ast.body and isinstance(parsed_ast.body[-1], ast.Expr):
-            last_expr = ast.Expression(parsed_ast.body[-1].value)
-            code_to_exec = ast.Module(body=parsed_ast.body[:-1], type_ignores=[])
-            exec(compile(code_to_exec, "<string>", "exec"), namespace)
-            return eval(compile(last_expr, "<string>", "eval"), namespace)
-        else:
-            exec(code, namespace)
-            return None
     except SyntaxError:
         exec(code, namespace)
         return None
+    if parsed_ast.body and isinstance(parsed_ast.body[-1], ast.Expr):
+        last_expr = ast.Expression(parsed_ast.body[-1].value)
+        code_to_exec = ast.Module(body=parsed_ast.body[:-1], type_ignores=[])
+        exec(compile(code_to_exec, "<string>", "exec"), namespace)
+        return eval(compile(last_expr, "<string>", "eval"), namespace)
+    exec(compile(parsed_ast, "<string>", "exec"), namespace)
+    return None
 
 
-def extract_function_definitions(code: str) -> list[str]:
-    """Extract function definitions from code as executable strings."""
+def extract_function_definitions(
+    code: str, tree: ast.Module | None = None
+) -> list[str]:
+    """Extract top-level function definitions from code as executable strings."""
     function_defs = []
-    try:
-        tree = ast.parse(code)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                lines = code.split("\n")
-                start_line = node.lineno - 1
-                end_line = (
-                    node.end_lineno if hasattr(node, "end_lineno") else start_line + 1
-                )
-                func_lines = lines[start_line:end_line]
-                func_def = "\n".join(func_lines)
-                function_defs.append(func_def)
-    except SyntaxError:
-        pass
+    if tree is None:
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            return function_defs
+    lines = code.split("\n")
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            function_defs.append("\n".join(lines[node.lineno - 1 : node.end_lineno]))
     return function_defs
 
 
@@ -90,25 +135,34 @@ def filter_picklable_namespace(
     Special handling for openpyxl Workbook objects: saves them to temp files
     and stores WorkbookReference objects instead.
     """
-    builtin_functions = _get_builtin_function_names()
-
-    temp_dir = get_temp_workbooks_dir(user_id, session_id, base_dir)
+    # Created by save_workbook only when a workbook is actually saved
+    temp_dir = _temp_workbooks_path(user_id, session_id, base_dir)
     openpyxl_items, openpyxl_keys, messages = filter_openpyxl_from_namespace(
         namespace, temp_dir
     )
 
     result = dict(openpyxl_items)
+    picklable_by_id: dict[int, bool] = {}
 
     for key, value in namespace.items():
         if key in openpyxl_keys:
             continue
         if (
-            key in builtin_functions
+            key in _BUILTIN_FUNCTION_NAMES
             or key == "__builtins__"
             or isinstance(value, types.ModuleType)
         ):
             continue
-        if is_picklable(value):
+        # Scalars always pickle; containers go to the probe, which is faster
+        # than walking them in Python
+        if type(value) in _TRIVIALLY_PICKLABLE:
+            result[key] = value
+            continue
+        # The same object bound to several names is only probed once
+        picklable = picklable_by_id.get(id(value))
+        if picklable is None:
+            picklable = picklable_by_id[id(value)] = is_picklable(value)
+        if picklable:
             result[key] = value
         else:
             hint = _get_unpicklable_hint(key, value)
@@ -123,48 +177,63 @@ def get_temp_workbooks_dir(
     session_id: str | None = None,
     base_dir: Path | None = None,
 ) -> Path:
-    """Get directory for temporary workbook storage.
+    """Get directory for temporary workbook storage, creating it if needed.
 
     When called from the executor (inside sandbox), base_dir is the repl_dir
     passed via CLI argument. Otherwise, computes from DATA_DIR on the host.
     """
+    temp_dir = _temp_workbooks_path(user_id, session_id, base_dir)
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    return temp_dir
+
+
+def _temp_workbooks_path(
+    user_id: str | None = None,
+    session_id: str | None = None,
+    base_dir: Path | None = None,
+) -> Path:
+    """Path of the temporary workbook directory, without creating it."""
     if base_dir is not None:
-        temp_dir = base_dir / ".temp" / "workbooks"
-    else:
-        from agentic_patterns.core.repl.sandbox import get_repl_data_dir
+        return base_dir / ".temp" / "workbooks"
 
-        if user_id is not None and session_id is not None:
-            temp_dir = get_repl_data_dir(user_id, session_id) / ".temp" / "workbooks"
-        else:
-            from agentic_patterns.core.user_session import get_session_id, get_user_id
+    from agentic_patterns.core.repl.sandbox import get_repl_data_dir
 
-            temp_dir = (
-                get_repl_data_dir(get_user_id(), get_session_id())
-                / ".temp"
-                / "workbooks"
-            )
+    if user_id is None or session_id is None:
+        from agentic_patterns.core.user_session import get_session_id, get_user_id
+
+        user_id, session_id = get_user_id(), get_session_id()
+    return get_repl_data_dir(user_id, session_id) / ".temp" / "workbooks"
 
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    return temp_dir
+
+def _discard_buffer(buffer: pickle.PickleBuffer) -> None:
+    """buffer_callback that keeps large buffers out-of-band, i.e. never copies them."""
 
 
 def is_picklable(obj: Any) -> bool:
-    """Check if an object can be pickled AND unpickled."""
+    """Check if an object can be pickled (dumps only, no round-trip)."""
     try:
-        data = pickle.dumps(obj)
-        pickle.loads(data)
+        pickle.dumps(obj, protocol=PICKLE_PROTOCOL, buffer_callback=_discard_buffer)
         return True
     except Exception:
         return False
 
 
-def _get_builtin_function_names() -> set[str]:
-    return set(
-        filter(
-            lambda x: isinstance(getattr(builtins, x, None), types.BuiltinFunctionType),
-            dir(builtins),
-        )
-    )
+def write_subprocess_result(result: SubprocessResult, path: Path) -> None:
+    """Pickle a SubprocessResult to a file, dropping entries that fail a round-trip."""
+    with open(path, "wb") as f:
+        try:
+            pickle.dump(result, f, protocol=PICKLE_PROTOCOL)
+            return
+        except Exception:
+            f.seek(0)
+            f.truncate()
+        for key, value in list(result.namespace.items()):
+            try:
+                pickle.loads(pickle.dumps(value, protocol=PICKLE_PROTOCOL))
+            except Exception:
+                logger.warning("Dropping unpicklable namespace entry '%s'", key)
+                del result.namespace[key]
+        pickle.dump(result, f, protocol=PICKLE_PROTOCOL)
 
 
 def _get_unpicklable_hint(key: str, value: Any) -> str | None:
@@ -1,3 +1,10 @@
 DEFAULT_CELL_TIMEOUT = 30
 MAX_CELLS = 100
 REPL_SANDBOX_MOUNT = "/repl"
+
+# Protocol 5 (PEP 574) lets numpy/pandas pickle their buffers without an extra copy
+PICKLE_PROTOCOL = 5
+
+# zlib level for captured figure PNGs: level 1 encodes several times faster than
+# the default 6, for somewhat larger files
+PNG_COMPRESS_LEVEL = 1
@@ -1,17 +1,20 @@
 """Standalone executor script that runs inside a sandbox.
 
-Entry point: python -m agentic_patterns.core.repl.executor <repl_dir> <cell_id>
+Entry point: python -m agentic_patterns.core.repl.executor <repl_dir> <cell_id> [-]
 
-Reads pickled input from <repl_dir>/<cell_id>_input.pkl, executes the code,
+Reads pickled input from <repl_dir>/<cell_id>_input.pkl (or marshalled input
+from stdin when the optional "-" argument is given), executes the code,
 and writes pickled SubprocessResult to <repl_dir>/<cell_id>_output.pkl.
 """
 
 import io
+import marshal
 import os
 import pickle
 import sys
 import traceback
 from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime
 from pathlib import Path
 
 from agentic_patterns.core.repl.cell_output import CellOutput
@@ -19,6 +22,7 @@ from agentic_patterns.core.repl.cell_utils import (
     SubprocessResult,
     execute_and_capture_last_expression,
     filter_picklable_namespace,
+    write_subprocess_result,
 )
 from agentic_patterns.core.repl.enums import CellState, OutputType
 from agentic_patterns.core.repl.matplotlib_backend import (
@@ -58,7 +62,11 @@ def main() -> None:
     input_path = repl_dir / f"{cell_id}_input.pkl"
     output_path = repl_dir / f"{cell_id}_output.pkl"
 
-    input_data = pickle.loads(input_path.read_bytes())
+    if len(sys.argv) > 3 and sys.argv[3] == "-":
+        input_data = marshal.loads(sys.stdin.buffer.read())
+    else:
+        with open(input_path, "rb") as f:
+            input_data = pickle.load(f)
 
     code = input_data["code"]
     namespace = input_data["namespace"]
@@ -92,19 +100,33 @@ def main() -> None:
                     print(f"Failed to execute function definition: {e}")
 
             last_value = execute_and_capture_last_expression(code, namespace)
+            # One clock read for the outputs collected right after execution
+            now = datetime.now()
 
             if last_value is not None:
                 result.outputs.append(
-                    CellOutput(output_type=OutputType.TEXT, content=repr(last_value))
+                    CellOutput(
+                        output_type=OutputType.TEXT,
+                        content=repr(last_value),
+                        timestamp=now,
+                    )
                 )
 
             if stdout_text := stdout_buf.getvalue():
                 result.outputs.append(
-                    CellOutput(output_type=OutputType.TEXT, content=stdout_text)
+                    CellOutput(
+                        output_type=OutputType.TEXT,
+                        content=stdout_text,
+                        timestamp=now,
+                    )
                 )
             if stderr_text := stderr_buf.getvalue():
                 result.outputs.append(
-                    CellOutput(output_type=OutputType.ERROR, content=stderr_text)
+                    CellOutput(
+                        output_type=OutputType.ERROR,
+                        content=stderr_text,
+                        timestamp=now,
+                    )
                 )
 
             figure_outputs = capture_matplotlib_figures()
@@ -129,7 +151,7 @@ def main() -> None:
             )
         )
 
-    output_path.write_bytes(pickle.dumps(result))
+    write_subprocess_result(result, output_path)
 
 
 if __name__ == "__main__":
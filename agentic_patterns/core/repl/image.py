@@ -1,12 +1,16 @@
-import base64
 import io
 from abc import ABC, abstractmethod
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from PIL import Image as PILImage
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+from agentic_patterns.core.repl.base64_codec import b64decode, b64encode_str
+from agentic_patterns.core.repl.config import PNG_COMPRESS_LEVEL
 
 
 class ImageBase(BaseModel, ABC):
@@ -18,6 +22,11 @@ class ImageBase(BaseModel, ABC):
     source: str | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    @field_validator("format")
+    @classmethod
+    def _lowercase_format(cls, value: str) -> str:
+        return value.lower()
+
     def _get_dimensions_str(self) -> str:
         if self.width and self.height:
             return f" {self.width}x{self.height}"
@@ -40,24 +49,43 @@ class Image(ImageBase):
 
     data: bytes
 
+    # unserialize() input comes from our own serialize(); set to False to
+    # validate the base64 alphabet of external data
+    TRUSTED_SOURCE: ClassVar[bool] = True
+
+    # (data object, its base64 encoding); checked by identity so a reassigned
+    # `data` is re-encoded
+    _b64_cache: tuple[bytes, str] | None = PrivateAttr(default=None)
+
     def __str__(self) -> str:
         dimensions = self._get_dimensions_str()
         source_info = self._get_source_str()
         return f"Image[{self.format}{dimensions}{source_info}]"
 
     def get_data_base64(self) -> str:
-        return base64.b64encode(self.data).decode()
+        """Base64 of the image data, encoded once and reused on every notebook save."""
+        cached = self._b64_cache
+        if cached is not None and cached[0] is self.data:
+            return cached[1]
+        encoded = b64encode_str(self.data)
+        self._b64_cache = (self.data, encoded)
+        return encoded
 
     def save_to_file(self, path: str | Path, format: str | None = None) -> None:
         if isinstance(path, str):
             path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        if format and format.lower() != self.format.lower():
-            img = PILImage.open(io.BytesIO(self.data))
-            img.save(path, format=format.upper())
+        if not format or format.lower() == self.format:
+            write = partial(path.write_bytes, self.data)
         else:
-            with open(path, "wb") as f:
-                f.write(self.data)
+            img = PILImage.open(io.BytesIO(self.data))
+            write = partial(img.save, path, format=format.upper())
+        # Batches of saves usually target an existing directory: only create
+        # it when the write fails, instead of a mkdir stat chain per image
+        try:
+            write()
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write()
 
     def serialize(self) -> dict:
         return {
@@ -71,8 +99,8 @@ class Image(ImageBase):
 
     @classmethod
     def unserialize(cls, data: dict) -> "Image":
-        binary_data = base64.b64decode(data["data"])
-        return cls(
+        binary_data = b64decode(data["data"], validate=not cls.TRUSTED_SOURCE)
+        image = cls(
             data=binary_data,
             format=data["format"],
             width=data.get("width"),
@@ -80,6 +108,9 @@ class Image(ImageBase):
             source=data.get("source"),
             metadata=data.get("metadata", {}),
         )
+        # Keep the encoding we were given, so re-saving does not re-encode
+        image._b64_cache = (image.data, data["data"])
+        return image
 
     def show(self) -> None:
         img = PILImage.open(io.BytesIO(self.data))
@@ -90,19 +121,25 @@ class Image(ImageBase):
 
     @classmethod
     def from_matplotlib_figure(cls, fig: plt.Figure) -> "Image":
-        fig_width, fig_height = fig.get_size_inches()
-        fig_dpi = fig.dpi
+        """Render a figure to PNG, reusing its Agg canvas when it already has one."""
         img_data = io.BytesIO()
-        fig.savefig(img_data, format="png")
-        img_data.seek(0)
-        binary_data = img_data.read()
+        pil_kwargs = {"compress_level": PNG_COMPRESS_LEVEL}
+        canvas = fig.canvas
+        if isinstance(canvas, FigureCanvasAgg):
+            canvas.print_png(img_data, pil_kwargs=pil_kwargs)
+            width, height = canvas.get_width_height()
+        else:
+            # savefig keeps the figure's own canvas and honours savefig rcParams
+            fig.savefig(img_data, format="png", pil_kwargs=pil_kwargs)
+            fig_width, fig_height = fig.get_size_inches()
+            width, height = int(fig_width * fig.dpi), int(fig_height * fig.dpi)
         return cls(
-            data=binary_data,
+            data=img_data.getvalue(),
             format="png",
-            width=int(fig_width * fig_dpi),
-            height=int(fig_height * fig_dpi),
+            width=width,
+            height=height,
             source="matplotlib",
-            metadata={"dpi": int(fig_dpi)},
+            metadata={"dpi": int(fig.dpi)},
         )
 
 
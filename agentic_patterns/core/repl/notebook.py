@@ -3,11 +3,13 @@
 import ast
 import json
 import logging
+import os
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from agentic_patterns.core.repl.cell import Cell
 from agentic_patterns.core.repl.cell_utils import (
@@ -27,6 +29,27 @@ from agentic_patterns.core.repl.enums import CellState
 
 logger = logging.getLogger(__name__)
 
+# cells.json is machine-written: compact output uses the C encoder and skips
+# the indentation whitespace
+_JSON_SEPARATORS = (",", ":")
+
+
+def _cell_to_json(cell: Cell) -> bytes:
+    # json.dumps escapes non-ASCII, so the encode is a plain copy
+    return json.dumps(cell.serialize(), separators=_JSON_SEPARATORS).encode()
+
+
+def _module_level_statements(body: list[ast.stmt]) -> Iterator[ast.stmt]:
+    """Statements executed at module level, including inside if/try/with/match/loops."""
+    for node in body:
+        yield node
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        for field in ("body", "orelse", "finalbody"):
+            yield from _module_level_statements(getattr(node, field, []))
+        for clause in getattr(node, "handlers", []) + getattr(node, "cases", []):
+            yield from _module_level_statements(clause.body)
+
 
 class Notebook(BaseModel):
     """Model representing a Jupyter-like notebook."""
@@ -40,6 +63,19 @@ class Notebook(BaseModel):
     function_definitions: list[str] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
+    # cell id -> (cell number, encoded JSON of cell.serialize())
+    _serialized_cells: dict[str, tuple[int | None, bytes]] = PrivateAttr(
+        default_factory=dict
+    )
+    # cell id -> position in cells; validated on use and rebuilt when stale
+    _id_to_index: dict[str, int] = PrivateAttr(default_factory=dict)
+    # Membership indexes for import_statements / function_definitions
+    _import_set: set[str] = PrivateAttr(default_factory=set)
+    _function_definition_set: set[str] = PrivateAttr(default_factory=set)
+
+    def model_post_init(self, context: Any, /) -> None:
+        self._import_set = set(self.import_statements)
+        self._function_definition_set = set(self.function_definitions)
 
     @staticmethod
     def _get_session_notebook_dir(user_id: str, session_id: str) -> Path:
@@ -66,6 +102,7 @@ class Notebook(BaseModel):
 
         if number is None or number >= len(self.cells):
             cell.cell_number = len(self.cells)
+            self._id_to_index[cell.id] = len(self.cells)
             self.cells.append(cell)
         else:
             number = max(number, 0)
@@ -81,6 +118,8 @@ class Notebook(BaseModel):
     def clear(self) -> None:
         """Clear all cells and reset the namespace."""
         self.cells = []
+        self._serialized_cells.clear()
+        self._id_to_index.clear()
         self.namespace = {}
         self.execution_count = 0
         cleanup_temp_workbooks(self.user_id, self.session_id)
@@ -97,15 +136,10 @@ class Notebook(BaseModel):
             cell_id = self.cells[cell_id_or_number].id
             del self.cells[cell_id_or_number]
         else:
-            cell_id = None
-            for i, cell in enumerate(self.cells):
-                if cell.id == cell_id_or_number:
-                    cell_id = cell.id
-                    del self.cells[i]
-                    break
-            else:
-                raise ValueError(f"Cell with ID {cell_id_or_number} not found")
+            cell_id = cell_id_or_number
+            del self.cells[self._index_of(cell_id)]
         if cell_id:
+            self._serialized_cells.pop(cell_id, None)
             delete_cell_pkl_files(self.user_id, self.session_id, cell_id)
         self._renumber_cells()
         self.save()
@@ -118,6 +152,7 @@ class Notebook(BaseModel):
             "Executing cell %s in notebook %s", cell_id_or_number, self.session_id
         )
         cell = self[cell_id_or_number]
+        self._serialized_cells.pop(cell.id, None)
 
         self.execution_count += 1
         if cell.execution_count is None:
@@ -132,36 +167,50 @@ class Notebook(BaseModel):
             self.session_id,
         )
 
-        if cell.state == CellState.COMPLETED:
+        # Cells without imports or function definitions (the common case)
+        # have nothing to record, so skip parsing them
+        code = cell.code
+        if cell.state == CellState.COMPLETED and ("import" in code or "def" in code):
             try:
-                tree = ast.parse(cell.code)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for name in node.names:
-                            import_stmt = f"import {name.name}"
-                            if name.asname:
-                                import_stmt += f" as {name.asname}"
-                            if import_stmt not in self.import_statements:
-                                self.import_statements.append(import_stmt)
-                    elif isinstance(node, ast.ImportFrom) and node.module:
-                        names_str = ", ".join(
-                            name.name + (f" as {name.asname}" if name.asname else "")
-                            for name in node.names
-                        )
-                        import_stmt = f"from {node.module} import {names_str}"
-                        if import_stmt not in self.import_statements:
-                            self.import_statements.append(import_stmt)
+                tree = ast.parse(code)
             except SyntaxError:
-                pass
-
-            new_function_defs = extract_function_definitions(cell.code)
-            for func_def in new_function_defs:
-                if func_def not in self.function_definitions:
-                    self.function_definitions.append(func_def)
+                tree = None
+            if tree is not None:
+                self._record_imports(tree)
+                for func_def in extract_function_definitions(code, tree):
+                    if func_def not in self._function_definition_set:
+                        self._function_definition_set.add(func_def)
+                        self.function_definitions.append(func_def)
 
         self.save()
         return cell
 
+    def _record_imports(self, tree: ast.Module) -> None:
+        """Remember the module-level import statements of an executed cell.
+
+        Imports inside functions and classes are skipped: they run with their
+        (replayed) definition, not at module level.
+        """
+        for node in _module_level_statements(tree.body):
+            if isinstance(node, ast.Import):
+                for name in node.names:
+                    import_stmt = f"import {name.name}"
+                    if name.asname:
+                        import_stmt += f" as {name.asname}"
+                    self._add_import(import_stmt)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                names_str = ", ".join(
+                    name.name + (f" as {name.asname}" if name.asname else "")
+                    for name in node.names
+                )
+                import_stmt = f"from {node.module} import {names_str}"
+                self._add_import(import_stmt)
+
+    def _add_import(self, import_stmt: str) -> None:
+        if import_stmt not in self._import_set:
+            self._import_set.add(import_stmt)
+            self.import_statements.append(import_stmt)
+
     @property
     def id(self) -> str:
         return f"{self.user_id}:{self.session_id}"
@@ -212,11 +261,32 @@ class Notebook(BaseModel):
             "execution_count": self.execution_count,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
-            "cells": [cell.serialize() for cell in self.cells],
+            "cells": [],
         }
-
-        with open(notebook_path, "w") as f:
-            json.dump(data, f, indent=2)
+        header = json.dumps(data, separators=_JSON_SEPARATORS)
+        self._serialize_stale_cells()
+
+        # Same bytes as json.dumps(data) with the cached cell fragments inlined.
+        # The fragments are written one by one rather than joined, so large
+        # (image) payloads are never copied into one big string.
+        # Write a sibling temp file and swap it in, so a crash mid-write never
+        # leaves a truncated cells.json behind.
+        tmp_path = notebook_path.with_name(f"{notebook_path.name}.tmp.{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(header.removesuffix("]}").encode())
+            for i, cell in enumerate(self.cells):
+                if i:
+                    f.write(b",")
+                f.write(self._serialized_cells[cell.id][1])
+            f.write(b"]}")
+        os.replace(tmp_path, notebook_path)
+
+    def _serialize_stale_cells(self) -> None:
+        """Refresh the cached JSON of cells changed since the last save."""
+        cache = self._serialized_cells
+        for cell in self.cells:
+            if cell.id not in cache or cache[cell.id][0] != cell.cell_number:
+                cache[cell.id] = (cell.cell_number, _cell_to_json(cell))
 
     def __getitem__(self, key: int | str) -> Cell:
         if isinstance(key, int):
@@ -226,14 +296,26 @@ class Notebook(BaseModel):
                 )
             return self.cells[key]
         else:
-            for cell in self.cells:
-                if cell.id == key:
-                    return cell
-            raise ValueError(f"Cell with ID {key} not found")
+            return self.cells[self._index_of(key)]
+
+    def _index_of(self, cell_id: str) -> int:
+        """Position of a cell by ID (O(1); the index is rebuilt if stale)."""
+        index = self._id_to_index.get(cell_id)
+        cells = self.cells
+        if index is None or index >= len(cells) or cells[index].id != cell_id:
+            self._rebuild_index()
+            index = self._id_to_index.get(cell_id)
+            if index is None:
+                raise ValueError(f"Cell with ID {cell_id} not found")
+        return index
+
+    def _rebuild_index(self) -> None:
+        self._id_to_index = {cell.id: i for i, cell in enumerate(self.cells)}
 
     def _renumber_cells(self) -> None:
         for i, cell in enumerate(self.cells):
             cell.cell_number = i
+        self._rebuild_index()
 
     def __repr__(self) -> str:
         return f"Notebook(user_id={self.user_id}, session_id={self.session_id}, cells={len(self.cells)})"
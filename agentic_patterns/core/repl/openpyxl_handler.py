@@ -1,9 +1,18 @@
 """Handles serialization of openpyxl Workbook objects across subprocess boundaries."""
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from pydantic import BaseModel
 
+WORKBOOK_SAVE_MAX_WORKERS = 4
+# Temp workbooks only carry state to the next cell: fast zlib, not small files
+WORKBOOK_TEMP_COMPRESS_LEVEL = 1
+
 
 class WorkbookReference(BaseModel):
     """Reference to a workbook saved in a temp file for IPC."""
@@ -26,11 +35,16 @@ def filter_openpyxl_from_namespace(
     result = {}
     handled_keys = set()
     messages = []
+    key_by_id: dict[int, str] | None = None
+    pending_saves: list[tuple[Any, str]] = []
 
     for key, value in namespace.items():
+        if not _may_be_openpyxl_related(type(value)):
+            continue
+
         if is_saveable_workbook(value):
-            wb_ref = save_workbook(value, key, temp_dir)
-            result[key] = wb_ref.model_dump()
+            result[key] = None  # filled in once the pending saves complete
+            pending_saves.append((value, key))
             handled_keys.add(key)
             continue
 
@@ -43,9 +57,8 @@ def filter_openpyxl_from_namespace(
             continue
 
         if is_openpyxl_workbook_reference(value):
-            wb = load_workbook_from_reference(value)
-            wb_ref = save_workbook(wb, key, temp_dir)
-            result[key] = wb_ref.model_dump()
+            result[key] = None
+            pending_saves.append((load_workbook_from_reference(value), key))
             handled_keys.add(key)
             continue
 
@@ -53,10 +66,12 @@ def filter_openpyxl_from_namespace(
             parent_wb = getattr(value, "parent", None)
             wb_var = None
             if parent_wb is not None:
-                for k, v in namespace.items():
-                    if v is parent_wb:
-                        wb_var = k
-                        break
+                if key_by_id is None:
+                    # Built once, on the first worksheet; first name wins
+                    key_by_id = {}
+                    for k, v in namespace.items():
+                        key_by_id.setdefault(id(v), k)
+                wb_var = key_by_id.get(id(parent_wb))
             if wb_var:
                 messages.append(
                     f"Note: worksheet '{key}' not persisted - re-access via: {key} = {wb_var}.active"
@@ -72,13 +87,47 @@ def filter_openpyxl_from_namespace(
             handled_keys.add(key)
             continue
 
+    for wb_ref in _save_workbooks(pending_saves, temp_dir):
+        result[wb_ref.var_name] = wb_ref.model_dump()
+
     return result, handled_keys, messages
 
 
+def _save_workbooks(
+    workbooks: list[tuple[Any, str]], temp_dir: Path
+) -> list[WorkbookReference]:
+    """Save (workbook, var_name) pairs, in parallel threads when there are several."""
+    # A workbook bound to several names must not be saved concurrently with itself
+    if len(workbooks) < 2 or len({id(wb) for wb, _ in workbooks}) < len(workbooks):
+        return [save_workbook(wb, var_name, temp_dir) for wb, var_name in workbooks]
+    with ThreadPoolExecutor(
+        max_workers=min(WORKBOOK_SAVE_MAX_WORKERS, len(workbooks))
+    ) as executor:
+        return list(
+            executor.map(
+                lambda item: save_workbook(item[0], item[1], temp_dir), workbooks
+            )
+        )
+
+
+@lru_cache(maxsize=256)
+def _may_be_openpyxl_related(obj_type: type) -> bool:
+    """Whether values of this type need the openpyxl checks (openpyxl types, references, dicts)."""
+    return _type_is_openpyxl(obj_type) or issubclass(
+        obj_type, (WorkbookReference, dict)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _type_is_openpyxl(obj_type: type) -> bool:
+    """Whether a type is defined in openpyxl (cached per type)."""
+    module_name = getattr(obj_type, "__module__", "") or ""
+    return module_name.startswith("openpyxl.")
+
+
 def is_openpyxl_object(obj) -> bool:
     """Check if an object is any openpyxl type."""
-    module_name = getattr(type(obj), "__module__", "")
-    return module_name.startswith("openpyxl.")
+    return _type_is_openpyxl(type(obj))
 
 
 def is_openpyxl_workbook(obj) -> bool:
@@ -86,8 +135,7 @@ def is_openpyxl_workbook(obj) -> bool:
     obj_type = type(obj)
     if obj_type.__name__ != "Workbook":
         return False
-    module_name = getattr(obj_type, "__module__", "")
-    if not module_name.startswith("openpyxl."):
+    if not _type_is_openpyxl(obj_type):
         return False
     return hasattr(obj, "active") and hasattr(obj, "save")
 
@@ -106,8 +154,7 @@ def is_openpyxl_worksheet(obj) -> bool:
     obj_type = type(obj)
     if obj_type.__name__ != "Worksheet":
         return False
-    module_name = getattr(obj_type, "__module__", "")
-    if not module_name.startswith("openpyxl."):
+    if not _type_is_openpyxl(obj_type):
         return False
     return hasattr(obj, "parent") and hasattr(obj, "cell")
 
@@ -145,6 +192,30 @@ def restore_workbook_references(namespace: dict) -> None:
 
 def save_workbook(workbook, var_name: str, temp_dir: Path) -> WorkbookReference:
     """Save a workbook to a temp file and return a reference."""
+    temp_dir.mkdir(parents=True, exist_ok=True)
     temp_path = temp_dir / f"{var_name}.xlsx"
-    workbook.save(temp_path)
+    _save_fast(workbook, temp_path)
     return WorkbookReference(temp_path=temp_path, var_name=var_name)
+
+
+def _save_fast(workbook, path: Path) -> None:
+    """Workbook.save, deflating at WORKBOOK_TEMP_COMPRESS_LEVEL."""
+    try:
+        from openpyxl.writer.excel import ExcelWriter
+    except ImportError:  # openpyxl moved its writer: keep the default level
+        workbook.save(path)
+        return
+    # Same guards and timestamp as Workbook.save / openpyxl's save_workbook
+    if workbook.read_only:
+        raise TypeError("Workbook is read-only")
+    if workbook.write_only and not workbook.worksheets:
+        workbook.create_sheet()
+    with ZipFile(
+        path,
+        "w",
+        ZIP_DEFLATED,
+        allowZip64=True,
+        compresslevel=WORKBOOK_TEMP_COMPRESS_LEVEL,
+    ) as archive:
+        workbook.properties.modified = datetime.now(tz=UTC).replace(tzinfo=None)
+        ExcelWriter(workbook, archive).save()
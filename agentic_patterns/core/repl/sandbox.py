@@ -14,35 +14,91 @@ Sandbox selection order:
 3. Raises RuntimeError (no silent fallback to unsandboxed execution)
 """
 
-import base64
+import asyncio
+import atexit
+import hashlib
 import logging
+import marshal
+import os
 import pickle
-import shutil
+import socket
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
+from agentic_patterns.core.compliance.private_data import session_has_private_data
+from agentic_patterns.core.repl.base64_codec import b64decode
 from agentic_patterns.core.repl.cell_output import CellOutput
-from agentic_patterns.core.repl.cell_utils import SubprocessResult
-from agentic_patterns.core.repl.config import REPL_SANDBOX_MOUNT
+from agentic_patterns.core.repl.cell_utils import SubprocessResult, remove_tree
+from agentic_patterns.core.repl.config import PICKLE_PROTOCOL, REPL_SANDBOX_MOUNT
 from agentic_patterns.core.repl.enums import CellState, OutputType
 from agentic_patterns.core.repl.image import Image
+from agentic_patterns.core.repl.standalone_executor import EXECUTOR_SOURCE
 from agentic_patterns.core.process_sandbox import BindMount, get_sandbox
+from agentic_patterns.core.sandbox.config import (
+    get_sandbox_profile,
+    load_sandbox_config,
+)
 
 logger = logging.getLogger(__name__)
 
 
+DOCKER_CHECK_TTL = 60.0  # seconds
+DOCKER_PROBE_TIMEOUT = 0.1  # seconds
+
+# (monotonic time of the check, result)
+_docker_check: tuple[float, bool] | None = None
+
+# Docker executor module name; the source hash makes an updated executor a new file
+_EXECUTOR_MODULE = (
+    "_executor_" + hashlib.blake2b(EXECUTOR_SOURCE.encode(), digest_size=8).hexdigest()
+)
+
+# Sessions seen with private data. Only positives are cached: a session can
+# become private at any time, and a stale False would leave the network open
+_private_sessions: set[tuple[str, str]] = set()
+
+# Docker SandboxManager per (user_id, session_id), reused across cells.
+# Closed by delete_repl_dir, and at interpreter exit for whatever is left
+_docker_managers: dict[tuple[str, str], Any] = {}
+_docker_managers_lock = threading.Lock()
+
+
 def _is_docker_available() -> bool:
-    """Check if Docker daemon is reachable via docker_host from config.yaml."""
-    try:
-        import docker
+    """Check if Docker daemon is reachable; the answer is reused for DOCKER_CHECK_TTL."""
+    global _docker_check
+    now = time.monotonic()
+    if _docker_check is not None and now - _docker_check[0] < DOCKER_CHECK_TTL:
+        return _docker_check[1]
+    available = _check_docker()
+    _docker_check = (now, available)
+    return available
 
-        from agentic_patterns.core.sandbox.config import load_sandbox_config
 
+def _check_docker() -> bool:
+    """Check if Docker daemon is reachable via docker_host from config.yaml."""
+    try:
         docker_host = load_sandbox_config().docker_host
         if not docker_host:
             return False
+        url = urlsplit(docker_host)
+        if url.scheme == "unix":
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(DOCKER_PROBE_TIMEOUT)
+                sock.connect(url.path)
+            return True
+        if url.scheme in ("tcp", "http", "https") and url.hostname and url.port:
+            with socket.create_connection(
+                (url.hostname, url.port), timeout=DOCKER_PROBE_TIMEOUT
+            ):
+                return True
+
+        import docker
+
         client = docker.DockerClient(base_url=docker_host)
         client.ping()
         return True
@@ -50,6 +106,25 @@ def _is_docker_available() -> bool:
         return False
 
 
+def _dump_pickle(obj: Any, path: Path | str) -> None:
+    """Pickle to a temp file and rename it into place, so no reader sees a partial pickle."""
+    tmp_path = f"{os.fspath(path)}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(obj, f, protocol=PICKLE_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _load_pickle(path: Path) -> Any:
+    """Unpickle a file by streaming it, without first reading it into a bytes copy."""
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
 def get_repl_data_dir(user_id: str, session_id: str) -> Path:
     """Get the REPL data directory for a user/session (host-side)."""
     from agentic_patterns.core.config.config import DATA_DIR
@@ -58,18 +133,28 @@ def get_repl_data_dir(user_id: str, session_id: str) -> Path:
 
 
 def delete_cell_pkl_files(user_id: str, session_id: str, cell_id: str) -> None:
-    """Remove the input/output pkl files for a given cell."""
-    repl_dir = get_repl_data_dir(user_id, session_id)
-    for suffix in ("input", "output"):
-        pkl_file = repl_dir / f"{cell_id}_{suffix}.pkl"
-        pkl_file.unlink(missing_ok=True)
+    """Remove the input/output pkl files for a given cell (plain os.unlink, no Path per file)."""
+    repl_dir = os.fspath(get_repl_data_dir(user_id, session_id))
+    for name in (f"{cell_id}_input.pkl", f"{cell_id}_output.pkl"):
+        try:
+            os.unlink(os.path.join(repl_dir, name))
+        except FileNotFoundError:
+            pass
 
 
 def delete_repl_dir(user_id: str, session_id: str) -> None:
     """Remove the entire REPL data directory for a user/session."""
+    with _docker_managers_lock:
+        manager = _docker_managers.pop((user_id, session_id), None)
+    if manager is not None:
+        _close_docker_manager(manager)
+    _private_sessions.discard((user_id, session_id))
     repl_dir = get_repl_data_dir(user_id, session_id)
     if repl_dir.exists():
-        shutil.rmtree(repl_dir, ignore_errors=True)
+        try:
+            remove_tree(repl_dir)
+        except OSError as e:
+            logger.warning("Failed to remove REPL directory %s: %s", repl_dir, e)
 
 
 async def execute_in_sandbox(
@@ -96,7 +181,7 @@ async def execute_in_sandbox(
         "session_id": session_id,
         "workspace_path": "/workspace",
     }
-    (repl_dir / f"{cell_id}_input.pkl").write_bytes(pickle.dumps(input_data))
+    input_path = os.path.join(repl_dir, f"{cell_id}_input.pkl")
 
     # Try bwrap first, then Docker, then fail loudly.
     try:
@@ -105,6 +190,15 @@ async def execute_in_sandbox(
         sandbox = None
 
     if sandbox is not None:
+        stdin = None
+        if namespace:
+            # Pickling a large namespace is CPU/IO heavy; keep it off the event loop
+            await asyncio.to_thread(_dump_pickle, input_data, input_path)
+        else:
+            # Small input (no namespace, only strings): pipe it to the
+            # executor, no file. marshal is safe here: the executor runs
+            # under this same interpreter (sys.executable)
+            stdin = marshal.dumps(input_data)
         return await _execute_bwrap(
             sandbox,
             workspace_path,
@@ -115,8 +209,10 @@ async def execute_in_sandbox(
             timeout,
             user_id,
             session_id,
+            stdin,
         )
 
+    await asyncio.to_thread(_dump_pickle, input_data, input_path)
     if _is_docker_available():
         return await _execute_docker(
             workspace_path, repl_dir, cell_id, timeout, user_id, session_id
@@ -138,10 +234,13 @@ async def _execute_bwrap(
     timeout: int,
     user_id: str,
     session_id: str,
+    stdin: bytes | None = None,
 ) -> SubprocessResult:
-    """Execute via bubblewrap sandbox."""
-    from agentic_patterns.core.compliance.private_data import session_has_private_data
+    """Execute via bubblewrap sandbox.
 
+    If `stdin` is given it holds the marshalled input, and the executor reads
+    it from standard input instead of the input pkl file.
+    """
     command = [
         sys.executable,
         "-m",
@@ -149,12 +248,14 @@ async def _execute_bwrap(
         executor_repl_dir,
         cell_id,
     ]
+    if stdin is not None:
+        command.append("-")
 
     bind_mounts = [
         BindMount(workspace_path, "/workspace"),
         BindMount(repl_dir, REPL_SANDBOX_MOUNT),
     ]
-    isolate_network = session_has_private_data(user_id, session_id)
+    isolate_network = _is_private_session(user_id, session_id)
 
     result = await sandbox.run(
         command,
@@ -162,9 +263,10 @@ async def _execute_bwrap(
         bind_mounts=bind_mounts,
         isolate_network=isolate_network,
         cwd=executor_workspace,
+        stdin=stdin,
     )
 
-    return _process_sandbox_result(result, repl_dir, cell_id, timeout)
+    return await _process_sandbox_result(result, repl_dir, cell_id, timeout)
 
 
 async def _execute_docker(
@@ -177,23 +279,22 @@ async def _execute_docker(
 ) -> SubprocessResult:
     """Execute via Docker container using SandboxManager.
 
-    Writes a standalone executor script to repl_dir (mounted RW at /repl) so
+    Writes a standalone executor module to repl_dir (mounted RW at /repl) so
     the container needs zero agentic_patterns imports and no project mount.
     """
-    import asyncio
-
-    from agentic_patterns.core.repl.standalone_executor import EXECUTOR_SOURCE
-    from agentic_patterns.core.sandbox.config import get_sandbox_profile
-    from agentic_patterns.core.sandbox.manager import SandboxManager
+    _write_executor_module(repl_dir)
 
-    (repl_dir / "_executor.py").write_text(EXECUTOR_SOURCE)
-
-    manager = SandboxManager(
-        rw_mounts={str(repl_dir): REPL_SANDBOX_MOUNT},
-        profile=get_sandbox_profile("repl"),
-    )
+    manager = _get_docker_manager(repl_dir, user_id, session_id)
 
-    command = ["python", f"{REPL_SANDBOX_MOUNT}/_executor.py", cell_id]
+    command = [
+        "python",
+        "-c",
+        (
+            f"import sys; sys.path.insert(0, {REPL_SANDBOX_MOUNT!r}); "
+            f"import {_EXECUTOR_MODULE}; {_EXECUTOR_MODULE}.main()"
+        ),
+        cell_id,
+    ]
 
     try:
         exit_code, output = await asyncio.to_thread(
@@ -217,7 +318,8 @@ async def _execute_docker(
 
     output_path = repl_dir / f"{cell_id}_output.pkl"
     if output_path.exists():
-        return _dict_to_subprocess_result(pickle.loads(output_path.read_bytes()))
+        data = await asyncio.to_thread(_load_pickle, output_path)
+        return _dict_to_subprocess_result(data)
 
     return SubprocessResult(
         state=CellState.ERROR,
@@ -230,6 +332,59 @@ async def _execute_docker(
     )
 
 
+def _is_private_session(user_id: str, session_id: str) -> bool:
+    """session_has_private_data, remembering True so the flag file is read only once."""
+    key = (user_id, session_id)
+    if key in _private_sessions:
+        return True
+    if session_has_private_data(user_id, session_id):
+        _private_sessions.add(key)
+        return True
+    return False
+
+
+def _write_executor_module(repl_dir: Path) -> None:
+    """Write the standalone executor to repl_dir, unless this version is already there."""
+    executor_path = repl_dir / f"{_EXECUTOR_MODULE}.py"
+    if executor_path.exists():
+        return
+    tmp_path = executor_path.with_suffix(f".tmp.{os.getpid()}")
+    tmp_path.write_text(EXECUTOR_SOURCE)
+    os.replace(tmp_path, executor_path)
+
+
+def _get_docker_manager(repl_dir: Path, user_id: str, session_id: str) -> Any:
+    """Get the SandboxManager for a user/session, closed by delete_repl_dir."""
+    key = (user_id, session_id)
+    with _docker_managers_lock:
+        manager = _docker_managers.get(key)
+        if manager is None:
+            from agentic_patterns.core.sandbox.manager import SandboxManager
+
+            manager = _docker_managers[key] = SandboxManager(
+                rw_mounts={str(repl_dir): REPL_SANDBOX_MOUNT},
+                profile=get_sandbox_profile("repl"),
+            )
+    return manager
+
+
+def _close_docker_manager(manager: Any) -> None:
+    try:
+        manager.close()
+    except Exception as e:
+        logger.warning("Failed to close Docker sandbox manager: %s", e)
+
+
+@atexit.register
+def _close_docker_managers() -> None:
+    """Close the Docker managers of sessions never cleared (interpreter exit)."""
+    with _docker_managers_lock:
+        managers = list(_docker_managers.values())
+        _docker_managers.clear()
+    for manager in managers:
+        _close_docker_manager(manager)
+
+
 def _dict_to_subprocess_result(data: dict) -> SubprocessResult:
     """Convert plain dict from the standalone executor into a SubprocessResult."""
     state = CellState(data["state"])
@@ -239,8 +394,10 @@ def _dict_to_subprocess_result(data: dict) -> SubprocessResult:
         content = out["content"]
         ts = datetime.fromisoformat(out["timestamp"]) if out.get("timestamp") else None
         if output_type == OutputType.IMAGE and isinstance(content, dict):
+            data = content["data"]
             content = Image(
-                data=base64.b64decode(content["data"]),
+                # Raw bytes; base64 str from executors written by older versions
+                data=data if isinstance(data, bytes) else b64decode(data),
                 format=content["format"],
                 width=content.get("width"),
                 height=content.get("height"),
@@ -251,7 +408,7 @@ def _dict_to_subprocess_result(data: dict) -> SubprocessResult:
     return SubprocessResult(state=state, outputs=outputs, namespace=data.get("namespace", {}))
 
 
-def _process_sandbox_result(
+async def _process_sandbox_result(
     result: Any, repl_dir: Path, cell_id: str, timeout: int
 ) -> SubprocessResult:
     """Convert a SandboxResult into a SubprocessResult by reading the output pkl."""
@@ -268,7 +425,8 @@ def _process_sandbox_result(
 
     output_path = repl_dir / f"{cell_id}_output.pkl"
     if output_path.exists():
-        return pickle.loads(output_path.read_bytes())
+        # Unpickling a large namespace is CPU heavy; keep it off the event loop
+        return await asyncio.to_thread(_load_pickle, output_path)
 
     error_msg = (
         result.stderr.decode(errors="replace")
@@ -5,12 +5,12 @@ Docker container with zero agentic_patterns imports. It uses only stdlib plus
 container-installed packages (matplotlib, openpyxl, PIL).
 
 IPC protocol: reads plain dict from <cell_id>_input.pkl, writes plain dict to
-<cell_id>_output.pkl. The host converts dicts back to pydantic models.
+<cell_id>_output.pkl. The host converts dicts back to pydantic models. Image
+data is raw PNG bytes (pickle stores bytes as-is, no base64).
 """
 
 EXECUTOR_SOURCE = '''\
 import ast
-import base64
 import builtins
 import io
 import os
@@ -18,12 +18,19 @@ import pickle
 import sys
 import traceback
 import types
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime
 from pathlib import Path
 
 REPL_DIR = Path("/repl")
-_INTERNAL_MARKER = "_executor.py"
+REPL_DIR_STR = str(REPL_DIR)
+_INTERNAL_MARKER = os.path.basename(__file__)
+# Same protocol as the host side (not the interpreter default, 4 before 3.14)
+PICKLE_PROTOCOL = 5
+# Fast zlib level for figure PNGs, as on the host (config.PNG_COMPRESS_LEVEL)
+PNG_COMPRESS_LEVEL = 1
+FIGURE_ENCODE_MAX_WORKERS = 4
 
 
 def _make_output(output_type, content, timestamp=None):
@@ -52,16 +59,29 @@ def _capture_matplotlib_figures():
         import matplotlib.pyplot as plt
     except ImportError:
         return []
-    outputs = []
+    # Drawing touches pyplot state, so figures are rendered serially; the PNG
+    # encodes (zlib, GIL released) then run in parallel when there are several
+    rendered = []
     for fig_num in plt.get_fignums():
         fig = plt.figure(fig_num)
         fig_w, fig_h = fig.get_size_inches()
-        dpi = fig.dpi
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png")
-        buf.seek(0)
+        rendered.append((_render_figure(fig), fig.dpi, fig_w, fig_h))
+    plt.close("all")
+
+    images = [image for image, dpi, _, _ in rendered]
+    dpis = [dpi for _, dpi, _, _ in rendered]
+    if len(rendered) < 2:
+        encoded = list(map(_encode_png, images, dpis))
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(FIGURE_ENCODE_MAX_WORKERS, len(rendered))
+        ) as executor:
+            encoded = list(executor.map(_encode_png, images, dpis))
+
+    outputs = []
+    for png, (_, dpi, fig_w, fig_h) in zip(encoded, rendered):
         img_data = {
-            "data": base64.b64encode(buf.read()).decode(),
+            "data": png,
             "format": "png",
             "width": int(fig_w * dpi),
             "height": int(fig_h * dpi),
@@ -69,10 +89,34 @@ def _capture_matplotlib_figures():
             "metadata": {"dpi": int(dpi)},
         }
         outputs.append(_make_output("IMAGE", img_data))
-    plt.close("all")
     return outputs
 
 
+def _render_figure(fig):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from PIL import Image as PILImage
+    canvas = fig.canvas
+    if not isinstance(canvas, FigureCanvasAgg):
+        # No Agg buffer to copy: savefig encodes the PNG straight away
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL})
+        return buf.getvalue()
+    # Same pixels as print_png on the Agg canvas, copied out of the renderer
+    # so the figure can be closed
+    canvas.draw()
+    rgba = canvas.buffer_rgba()
+    height, width = rgba.shape[:2]
+    return PILImage.frombytes("RGBA", (width, height), rgba.tobytes())
+
+
+def _encode_png(image, dpi):
+    if isinstance(image, bytes):
+        return image
+    buf = io.BytesIO()
+    image.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL, dpi=(dpi, dpi))
+    return buf.getvalue()
+
+
 def _reset_matplotlib(original_show):
     if original_show is None:
         return
@@ -129,7 +173,8 @@ def _load_wb_from_ref(ref):
 
 
 def _restore_workbook_references(namespace):
-    for key, value in list(namespace.items()):
+    # Rebinding existing keys does not resize the dict: no copy of the items
+    for key, value in namespace.items():
         if _is_wb_ref(value):
             try:
                 namespace[key] = _load_wb_from_ref(value)
@@ -147,7 +192,11 @@ def _filter_openpyxl(namespace, temp_dir):
     result = {}
     handled = set()
     messages = []
+    key_by_id = None
     for key, value in namespace.items():
+        # Only openpyxl objects and dicts (reference form) need the checks below
+        if not isinstance(value, dict) and not _is_openpyxl_object(value):
+            continue
         if _is_saveable_workbook(value):
             result[key] = _save_workbook(value, key, temp_dir)
             handled.add(key)
@@ -166,10 +215,12 @@ def _filter_openpyxl(namespace, temp_dir):
             parent_wb = getattr(value, "parent", None)
             wb_var = None
             if parent_wb is not None:
-                for k, v in namespace.items():
-                    if v is parent_wb:
-                        wb_var = k
-                        break
+                if key_by_id is None:
+                    # Built once, on the first worksheet; first name wins
+                    key_by_id = {}
+                    for k, v in namespace.items():
+                        key_by_id.setdefault(id(v), k)
+                wb_var = key_by_id.get(id(parent_wb))
             if wb_var:
                 messages.append("Note: worksheet " + repr(key) + " not persisted - re-access via: " + key + " = " + wb_var + ".active")
             else:
@@ -182,20 +233,28 @@ def _filter_openpyxl(namespace, temp_dir):
 
 # -- namespace filtering -------------------------------------------------------
 
+# Exact types that always pickle; subclasses may carry unpicklable state
+_TRIVIALLY_PICKLABLE = frozenset({int, float, complex, str, bool, bytes, type(None)})
+
+
+def _discard_buffer(buffer):
+    pass
+
+
 def _is_picklable(obj):
+    # Serialization only, out-of-band buffers not copied: a loads() here would
+    # rebuild every object just to throw it away
     try:
-        data = pickle.dumps(obj)
-        pickle.loads(data)
+        pickle.dumps(obj, protocol=PICKLE_PROTOCOL, buffer_callback=_discard_buffer)
         return True
     except Exception:
         return False
 
 
-def _get_builtin_names():
-    return set(
-        name for name in dir(builtins)
-        if isinstance(getattr(builtins, name, None), types.BuiltinFunctionType)
-    )
+_BUILTIN_FUNCTION_NAMES = frozenset(
+    name for name in dir(builtins)
+    if isinstance(getattr(builtins, name, None), types.BuiltinFunctionType)
+)
 
 
 _UNPICKLABLE_HINTS = {
@@ -232,17 +291,25 @@ def _get_unpicklable_hint(key, value):
 
 
 def _filter_picklable_namespace(namespace, base_dir):
-    builtin_names = _get_builtin_names()
     temp_dir = base_dir / ".temp" / "workbooks"
     temp_dir.mkdir(parents=True, exist_ok=True)
     openpyxl_items, openpyxl_keys, messages = _filter_openpyxl(namespace, temp_dir)
     result = dict(openpyxl_items)
+    picklable_by_id = {}
     for key, value in namespace.items():
         if key in openpyxl_keys:
             continue
-        if key in builtin_names or key == "__builtins__" or isinstance(value, types.ModuleType):
+        if key in _BUILTIN_FUNCTION_NAMES or key == "__builtins__" or isinstance(value, types.ModuleType):
+            continue
+        # Scalars always pickle; containers go straight to the probe
+        if type(value) in _TRIVIALLY_PICKLABLE:
+            result[key] = value
             continue
-        if _is_picklable(value):
+        # The same object bound to several names is only probed once
+        picklable = picklable_by_id.get(id(value))
+        if picklable is None:
+            picklable = picklable_by_id[id(value)] = _is_picklable(value)
+        if picklable:
             result[key] = value
         else:
             hint = _get_unpicklable_hint(key, value)
@@ -254,19 +321,21 @@ def _filter_picklable_namespace(namespace, base_dir):
 # -- code execution ------------------------------------------------------------
 
 def _execute_and_capture_last(code, namespace):
+    # Parsed once; the tree is compiled directly, never the source again.
+    # Only a parse error falls back to exec(code): a SyntaxError raised while
+    # the cell runs must not execute it a second time
     try:
         parsed = ast.parse(code)
-        if parsed.body and isinstance(parsed.body[-1], ast.Expr):
-            last_expr = ast.Expression(parsed.body[-1].value)
-            rest = ast.Module(body=parsed.body[:-1], type_ignores=[])
-            exec(compile(rest, "<string>", "exec"), namespace)
-            return eval(compile(last_expr, "<string>", "eval"), namespace)
-        else:
-            exec(code, namespace)
-            return None
     except SyntaxError:
         exec(code, namespace)
         return None
+    if parsed.body and isinstance(parsed.body[-1], ast.Expr):
+        last_expr = ast.Expression(parsed.body[-1].value)
+        rest = ast.Module(body=parsed.body[:-1], type_ignores=[])
+        exec(compile(rest, "<string>", "exec"), namespace)
+        return eval(compile(last_expr, "<string>", "eval"), namespace)
+    exec(compile(parsed, "<string>", "exec"), namespace)
+    return None
 
 
 def _format_cell_error(exc, code):
@@ -286,12 +355,34 @@ def _format_cell_error(exc, code):
     return chr(10).join(lines)
 
 
+def _write_result(result, output_path):
+    # The namespace was only probed with dumps(); if the final dump still
+    # fails, drop the entries that do not survive a full round-trip
+    with open(output_path, "wb") as f:
+        try:
+            pickle.dump(result, f, protocol=PICKLE_PROTOCOL)
+            return
+        except Exception:
+            f.seek(0)
+            f.truncate()
+        namespace = result["namespace"]
+        for key, value in list(namespace.items()):
+            try:
+                pickle.loads(pickle.dumps(value, protocol=PICKLE_PROTOCOL))
+            except Exception:
+                del namespace[key]
+        pickle.dump(result, f, protocol=PICKLE_PROTOCOL)
+
+
 def main():
     cell_id = sys.argv[1]
-    input_path = REPL_DIR / f"{cell_id}_input.pkl"
-    output_path = REPL_DIR / f"{cell_id}_output.pkl"
+    # Plain strings: open() takes them as-is, no Path objects on the IPC path
+    input_path = f"{REPL_DIR_STR}/{cell_id}_input.pkl"
+    output_path = f"{REPL_DIR_STR}/{cell_id}_output.pkl"
 
-    input_data = pickle.loads(input_path.read_bytes())
+    # Streamed to and from the files: no whole-file bytes copy on either side
+    with open(input_path, "rb") as f:
+        input_data = pickle.load(f)
 
     code = input_data["code"]
     namespace = input_data["namespace"]
@@ -345,7 +436,7 @@ def main():
         outputs.append(_make_output("TEXT", chr(10).join(ns_messages)))
 
     result = {"state": state, "outputs": outputs, "namespace": filtered_ns}
-    output_path.write_bytes(pickle.dumps(result))
+    _write_result(result, output_path)
 
 
 if __name__ == "__main__":
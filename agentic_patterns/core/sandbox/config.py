@@ -2,10 +2,10 @@
 
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel
 
 from agentic_patterns.core.config.config import MAIN_PROJECT_DIR
+from agentic_patterns.core.config.utils import load_yaml
 
 
 class SandboxProfile(BaseModel):
@@ -42,7 +42,7 @@ def load_sandbox_config(config_path: Path | None = None) -> SandboxConfig:
 
     if config_path.exists():
         with open(config_path) as f:
-            yaml_config = yaml.safe_load(f)
+            yaml_config = load_yaml(f)
             if yaml_config and "sandbox" in yaml_config:
                 raw = yaml_config["sandbox"]
                 # Extract top-level sandbox fields (not profiles)
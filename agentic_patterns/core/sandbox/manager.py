@@ -67,6 +67,14 @@ class SandboxManager:
         del self._sessions[key]
         logger.info("Closed session %s:%s", user_id, session_id)
 
+    def close(self) -> None:
+        """Close every session and release the Docker client."""
+        for user_id, session_id in list(self._sessions):
+            self.close_session(user_id, session_id)
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
     @contextmanager
     def ephemeral_session(
         self, user_id: str, session_id: str
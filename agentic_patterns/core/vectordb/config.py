@@ -4,9 +4,10 @@ import os
 import re
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel, Field
 
+from agentic_patterns.core.config.utils import load_yaml
+
 
 class OpenAIEmbeddingConfig(BaseModel):
     """Configuration for OpenAI embeddings."""
@@ -120,7 +121,7 @@ def load_vectordb_settings(config_path: Path | str) -> VectorDBSettings:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with open(config_path) as f:
-        data = yaml.safe_load(f)
+        data = load_yaml(f)
 
     embeddings: dict[str, EmbeddingConfig] = {}
     vectordb: dict[str, VectorDBConfig] = {}
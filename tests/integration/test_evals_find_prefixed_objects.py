@@ -3,6 +3,7 @@ from pathlib import Path
 
 from agentic_patterns.core.evals.discovery import (
     _find_datasets,
+    _find_eval_objects,
     _find_scorer_functions,
     _find_target_functions,
     load_module_from_file,
@@ -36,6 +37,12 @@ class TestFindPrefixedObjects(unittest.TestCase):
         name, func = scorers[0]
         self.assertEqual(name, "scorer_strict")
 
+    def test_find_eval_objects_matches_individual_finders(self):
+        datasets, targets, scorers = _find_eval_objects(self.module)
+        self.assertEqual(datasets, _find_datasets(self.module))
+        self.assertEqual(targets, _find_target_functions(self.module))
+        self.assertEqual(scorers, _find_scorer_functions(self.module))
+
 
 if __name__ == "__main__":
     unittest.main()
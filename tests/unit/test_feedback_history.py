@@ -0,0 +1,97 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pydantic_ai.messages import (
+    ModelMessagesTypeAdapter,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    UserPromptPart,
+)
+
+import agentic_patterns.core.feedback.feedback as _fb
+from agentic_patterns.core.feedback import (
+    append_session_history,
+    load_session_history,
+    save_session_history,
+)
+
+
+def _turn(prompt: str, answer: str) -> list:
+    return [
+        ModelRequest(parts=[UserPromptPart(content=prompt)]),
+        ModelResponse(parts=[TextPart(content=answer)]),
+    ]
+
+
+class TestSessionHistory(unittest.TestCase):
+    """Tests for session history persistence."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self._orig_feedback_dir = _fb.FEEDBACK_DIR
+        _fb.FEEDBACK_DIR = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        _fb.FEEDBACK_DIR = self._orig_feedback_dir
+        self.temp_dir.cleanup()
+
+    def test_load_missing_history_returns_empty(self):
+        self.assertEqual(load_session_history("alice", "s1"), [])
+
+    def _session_dir(self) -> Path:
+        return Path(self.temp_dir.name) / "alice" / "s1"
+
+    def test_append_writes_one_line_per_turn(self):
+        append_session_history(_turn("hi", "hello"), "alice", "s1")
+        append_session_history(_turn("2+2?", "4"), "alice", "s1")
+        path = Path(self.temp_dir.name) / "alice" / "s1" / _fb.HISTORY_FILENAME
+        self.assertEqual(len(path.read_bytes().splitlines()), 2)
+
+    def test_load_returns_all_turns_in_order(self):
+        append_session_history(_turn("hi", "hello"), "alice", "s1")
+        append_session_history(_turn("2+2?", "4"), "alice", "s1")
+        messages = load_session_history("alice", "s1")
+        self.assertEqual(len(messages), 4)
+        self.assertEqual(messages[0].parts[0].content, "hi")
+        self.assertEqual(messages[3].parts[0].content, "4")
+
+    def test_append_empty_is_noop(self):
+        append_session_history([], "alice", "s1")
+        path = Path(self.temp_dir.name) / "alice" / "s1" / _fb.HISTORY_FILENAME
+        self.assertFalse(path.exists())
+
+    def test_save_replaces_full_history(self):
+        first = _turn("hi", "hello")
+        save_session_history(first, "alice", "s1")
+        save_session_history(first + _turn("2+2?", "4"), "alice", "s1")
+        messages = load_session_history("alice", "s1")
+        self.assertEqual(len(messages), 4)
+        self.assertEqual(messages[2].parts[0].content, "2+2?")
+
+    def test_load_reads_legacy_history(self):
+        self._session_dir().mkdir(parents=True)
+        legacy_path = self._session_dir() / _fb.LEGACY_HISTORY_FILENAME
+        legacy_path.write_bytes(
+            ModelMessagesTypeAdapter.dump_json(_turn("hi", "hello"), indent=2)
+        )
+        messages = load_session_history("alice", "s1")
+        self.assertEqual([m.parts[0].content for m in messages], ["hi", "hello"])
+
+    def test_append_migrates_legacy_history(self):
+        self._session_dir().mkdir(parents=True)
+        legacy_path = self._session_dir() / _fb.LEGACY_HISTORY_FILENAME
+        legacy_path.write_bytes(
+            ModelMessagesTypeAdapter.dump_json(_turn("hi", "hello"), indent=2)
+        )
+        append_session_history(_turn("2+2?", "4"), "alice", "s1")
+        self.assertFalse(legacy_path.exists())
+        messages = load_session_history("alice", "s1")
+        self.assertEqual(
+            [m.parts[0].content for m in messages], ["hi", "hello", "2+2?", "4"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,16 @@
+import os
+import tempfile
 import unittest
 from pathlib import Path
 
-from agentic_patterns.core.mcp import get_mcp_client, get_mcp_server
+from agentic_patterns.core.mcp import (
+    MCPClientConfig,
+    MCPServerConfig,
+    clear_mcp_settings_cache,
+    get_mcp_client,
+    get_mcp_server,
+    load_mcp_settings,
+)
 
 TEST_DATA_DIR = Path(__file__).parent.parent / "data" / "mcp"
 
@@ -18,5 +27,106 @@ class TestMCP(unittest.TestCase):
         self.assertIn("not a server config", str(ctx.exception))
 
 
+class TestLoadMCPSettingsCache(unittest.TestCase):
+    def setUp(self):
+        clear_mcp_settings_cache()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = Path(self.temp_dir.name) / "config.yaml"
+        self._write("http://localhost:8000/mcp", 0)
+
+    def tearDown(self):
+        clear_mcp_settings_cache()
+        self.temp_dir.cleanup()
+
+    def _write(self, url: str, mtime_ns: int):
+        self.config_path.write_text(f"mcp_servers:\n  c1:\n    url: {url}\n")
+        os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    def test_repeated_loads_return_cached_settings(self):
+        first = load_mcp_settings(self.config_path)
+        second = load_mcp_settings(str(self.config_path))
+        self.assertIs(second.get("c1"), first.get("c1"))
+
+    def test_caller_mutation_does_not_leak(self):
+        first = load_mcp_settings(self.config_path)
+        first.mcp_servers.pop("c1")
+        self.assertIn("c1", load_mcp_settings(self.config_path).mcp_servers)
+
+    def test_cached_entries_are_frozen(self):
+        config = load_mcp_settings(self.config_path).get("c1")
+        with self.assertRaises(ValueError):
+            config.url = "http://other/mcp"
+
+    def test_clear_cache_rereads_file(self):
+        first = load_mcp_settings(self.config_path)
+        clear_mcp_settings_cache()
+        self.assertIsNot(load_mcp_settings(self.config_path).get("c1"), first.get("c1"))
+
+    def test_modified_file_is_reloaded(self):
+        first = load_mcp_settings(self.config_path)
+        self._write("http://localhost:9000/mcp", 10**18)
+        second = load_mcp_settings(self.config_path)
+        self.assertIsNot(second.get("c1"), first.get("c1"))
+        self.assertEqual(second.get("c1").url, "http://localhost:9000/mcp")
+
+    def test_referenced_env_change_invalidates_cache(self):
+        self._write("http://${TEST_MCP_HOST}/mcp", 0)
+        os.environ["TEST_MCP_HOST"] = "host-a"
+        try:
+            first = load_mcp_settings(self.config_path)
+            os.environ["TEST_MCP_UNRELATED"] = "x"
+            again = load_mcp_settings(self.config_path)
+            self.assertIs(again.get("c1"), first.get("c1"))
+            os.environ["TEST_MCP_HOST"] = "host-b"
+            second = load_mcp_settings(self.config_path)
+            self.assertEqual(second.get("c1").url, "http://host-b/mcp")
+        finally:
+            os.environ.pop("TEST_MCP_HOST", None)
+            os.environ.pop("TEST_MCP_UNRELATED", None)
+
+    def test_defaults_applied(self):
+        config = load_mcp_settings(self.config_path).get("c1")
+        self.assertEqual(config.name, "c1")
+        self.assertEqual(config.type, "client")
+        self.assertEqual(config.read_timeout, 60)
+        self.assertIsNone(config.url_isolated)
+
+    def test_load_validates_entries(self):
+        self.config_path.write_text("mcp_servers:\n  c1:\n    read_timeout: 5\n")
+        with self.assertRaises(ValueError):
+            load_mcp_settings(self.config_path)
+
+    def test_load_coerces_field_types(self):
+        self.config_path.write_text(
+            "mcp_servers:\n  c1:\n    url: http://localhost:8000/mcp\n"
+            "    read_timeout: '5'\n"
+        )
+        self.assertEqual(load_mcp_settings(self.config_path).get("c1").read_timeout, 5)
+
+    def test_load_rejects_mistyped_field(self):
+        self.config_path.write_text(
+            "mcp_servers:\n  c1:\n    url: http://localhost:8000/mcp\n"
+            "    read_timeout: soon\n"
+        )
+        with self.assertRaises(ValueError):
+            load_mcp_settings(self.config_path)
+
+    def test_load_dispatches_on_type(self):
+        self.config_path.write_text(
+            "mcp_servers:\n"
+            "  c1:\n    url: http://localhost:8000/mcp\n"
+            "  s1:\n    type: server\n    name: srv\n"
+        )
+        settings = load_mcp_settings(self.config_path)
+        self.assertIsInstance(settings.get("c1"), MCPClientConfig)
+        self.assertEqual(settings.get("c1").name, "c1")
+        self.assertIsInstance(settings.get("s1"), MCPServerConfig)
+
+    def test_unsupported_type_raises(self):
+        self.config_path.write_text("mcp_servers:\n  x:\n    type: other\n")
+        with self.assertRaises(ValueError):
+            load_mcp_settings(self.config_path)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -33,5 +35,31 @@ class TestPrompt(unittest.TestCase):
         self.assertIn("extra", str(ctx.exception))
 
 
+class TestPromptCache(unittest.TestCase):
+    """Tests for load_prompt memoization."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "greet.md"
+        self._write("Hello {name}.", 0)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, text: str, mtime_ns: int):
+        self.path.write_text(text, encoding="utf-8")
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_same_kwargs_return_cached_result(self):
+        first = load_prompt(self.path, name="Alice")
+        self.assertIs(load_prompt(self.path, name="Alice"), first)
+        self.assertEqual(load_prompt(self.path, name="Bob"), "Hello Bob.")
+
+    def test_modified_file_is_reloaded(self):
+        self.assertEqual(load_prompt(self.path, name="Alice"), "Hello Alice.")
+        self._write("Bye {name}.", 10**18)
+        self.assertEqual(load_prompt(self.path, name="Alice"), "Bye Alice.")
+
+
 if __name__ == "__main__":
     unittest.main()
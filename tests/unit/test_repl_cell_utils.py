@@ -0,0 +1,90 @@
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+import agentic_patterns.core.repl.cell_utils as cell_utils_module
+from agentic_patterns.core.repl.cell_output import CellOutput
+from agentic_patterns.core.repl.cell_utils import (
+    SubprocessResult,
+    remove_tree,
+    write_subprocess_result,
+)
+from agentic_patterns.core.repl.enums import OutputType
+
+
+class TestCellUtils(unittest.TestCase):
+    """Tests for agentic_patterns.core.repl.cell_utils module."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _make_tree(self, root: Path, n_files: int) -> None:
+        for i in range(n_files):
+            sub = root / f"d{i % 3}" / "nested"
+            sub.mkdir(parents=True, exist_ok=True)
+            (sub / f"f{i}.txt").write_text(str(i))
+        (root / "top.txt").write_text("top")
+
+    # -- remove_tree ------------------------------------------------------------
+
+    def test_remove_tree_small(self):
+        root = self.tmp_path / "tree"
+        self._make_tree(root, 5)
+        remove_tree(root)
+        self.assertFalse(root.exists())
+
+    def test_remove_tree_parallel(self):
+        root = self.tmp_path / "tree"
+        self._make_tree(root, cell_utils_module.REMOVE_TREE_PARALLEL_MIN_FILES + 10)
+        remove_tree(str(root))
+        self.assertFalse(root.exists())
+
+    def test_remove_tree_does_not_follow_symlinks(self):
+        outside = self.tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        root = self.tmp_path / "tree"
+        root.mkdir()
+        os.symlink(outside, root / "link")
+        remove_tree(root)
+        self.assertFalse(root.exists())
+        self.assertTrue((outside / "keep.txt").exists())
+
+    def test_remove_tree_missing_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            remove_tree(self.tmp_path / "missing")
+
+    # -- write_subprocess_result ------------------------------------------------
+
+    def test_write_subprocess_result(self):
+        path = self.tmp_path / "out.pkl"
+        result = SubprocessResult(
+            outputs=[CellOutput(output_type=OutputType.TEXT, content="hello")],
+            namespace={"x": 1, "items": [1, 2, 3]},
+        )
+        write_subprocess_result(result, path)
+        with open(path, "rb") as f:
+            loaded = pickle.load(f)
+        self.assertEqual(loaded.namespace, {"x": 1, "items": [1, 2, 3]})
+        self.assertEqual(loaded.outputs[0].content, "hello")
+
+    def test_write_subprocess_result_drops_unpicklable(self):
+        path = self.tmp_path / "out.pkl"
+        result = SubprocessResult(
+            namespace={"x": 1, "f": lambda: 1, "y": "kept"},
+        )
+        with self.assertLogs(cell_utils_module.logger, level="WARNING"):
+            write_subprocess_result(result, path)
+        with open(path, "rb") as f:
+            loaded = pickle.load(f)
+        self.assertEqual(loaded.namespace, {"x": 1, "y": "kept"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import marshal
+import pickle
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from agentic_patterns.core.repl.enums import CellState, OutputType
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+class TestExecutor(unittest.TestCase):
+    """Tests for agentic_patterns.core.repl.executor run as a subprocess."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repl_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _input_data(self, code: str) -> dict:
+        return {
+            "code": code,
+            "namespace": {},
+            "import_statements": [],
+            "function_definitions": [],
+            "user_id": "test_user",
+            "session_id": "test_session",
+            "workspace_path": str(self.repl_dir),
+        }
+
+    def _run(self, cell_id: str, args: list[str], stdin: bytes | None = None):
+        subprocess.run(
+            [sys.executable, "-m", "agentic_patterns.core.repl.executor"]
+            + [str(self.repl_dir), cell_id]
+            + args,
+            input=stdin,
+            cwd=PROJECT_ROOT,
+            check=True,
+            timeout=60,
+        )
+        with open(self.repl_dir / f"{cell_id}_output.pkl", "rb") as f:
+            return pickle.load(f)
+
+    def test_marshalled_stdin_input(self):
+        stdin = marshal.dumps(self._input_data("x = 40\nprint('hi')\nx + 2"))
+        result = self._run("cell1", ["-"], stdin)
+        self.assertEqual(result.state, CellState.COMPLETED)
+        self.assertEqual(
+            [(o.output_type, o.content) for o in result.outputs],
+            [(OutputType.TEXT, "42"), (OutputType.TEXT, "hi\n")],
+        )
+        self.assertEqual(result.namespace["x"], 40)
+        self.assertFalse((self.repl_dir / "cell1_input.pkl").exists())
+
+    def test_pickled_file_input(self):
+        with open(self.repl_dir / "cell2_input.pkl", "wb") as f:
+            pickle.dump(self._input_data("y = 'file'"), f)
+        result = self._run("cell2", [])
+        self.assertEqual(result.state, CellState.COMPLETED)
+        self.assertEqual(result.namespace["y"], "file")
+
+    def test_marshalled_stdin_error(self):
+        stdin = marshal.dumps(self._input_data("1 / 0"))
+        result = self._run("cell3", ["-"], stdin)
+        self.assertEqual(result.state, CellState.ERROR)
+        self.assertIn("ZeroDivisionError", result.outputs[0].content)
+
+
+if __name__ == "__main__":
+    unittest.main()
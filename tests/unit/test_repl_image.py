@@ -0,0 +1,32 @@
+import unittest
+
+from agentic_patterns.core.repl.image import Image
+
+
+class TestImage(unittest.TestCase):
+    """Tests for agentic_patterns.core.repl.image module."""
+
+    def test_base64_is_cached(self):
+        image = Image(data=b"\x89PNG fake image data")
+        encoded = image.get_data_base64()
+        self.assertEqual(encoded, "iVBORyBmYWtlIGltYWdlIGRhdGE=")
+        self.assertIs(image.get_data_base64(), encoded)
+
+    def test_base64_recomputed_when_data_reassigned(self):
+        image = Image(data=b"first")
+        first = image.get_data_base64()
+        image.data = b"second"
+        self.assertNotEqual(image.get_data_base64(), first)
+        self.assertEqual(image.get_data_base64(), "c2Vjb25k")
+
+    def test_unserialize_reuses_encoding(self):
+        original = Image(data=b"round trip", width=2, height=3, source="test")
+        data = original.serialize()
+        restored = Image.unserialize(data)
+        self.assertEqual(restored.data, b"round trip")
+        self.assertIs(restored.get_data_base64(), data["data"])
+        self.assertEqual(restored.serialize(), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import agentic_patterns.core.config.config as config_module
+import agentic_patterns.core.repl.sandbox as sandbox_module
+from agentic_patterns.core.repl.cell_output import CellOutput
+from agentic_patterns.core.repl.cell_utils import SubprocessResult
+from agentic_patterns.core.repl.enums import OutputType
+from agentic_patterns.core.repl.notebook import Notebook
+
+
+async def _fake_execute_in_sandbox(code, namespace, **kwargs) -> SubprocessResult:
+    return SubprocessResult(
+        outputs=[CellOutput(output_type=OutputType.TEXT, content=f"ran: {code}")],
+    )
+
+
+class TestNotebook(unittest.IsolatedAsyncioTestCase):
+    """Tests for agentic_patterns.core.repl.notebook module."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.temp_dir.name)
+        self._orig_data_dir = config_module.DATA_DIR
+        self._orig_workspace_dir = config_module.WORKSPACE_DIR
+        config_module.DATA_DIR = self.tmp_path / "data"
+        config_module.WORKSPACE_DIR = self.tmp_path / "workspace"
+        patcher = mock.patch.object(
+            sandbox_module, "execute_in_sandbox", _fake_execute_in_sandbox
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.notebook = Notebook.load("test_user", "test_session")
+
+    def tearDown(self):
+        config_module.DATA_DIR = self._orig_data_dir
+        config_module.WORKSPACE_DIR = self._orig_workspace_dir
+        self.temp_dir.cleanup()
+
+    def _notebook_path(self) -> Path:
+        return Notebook._get_notebook_path("test_user", "test_session")
+
+    async def test_save_load_round_trip(self):
+        await self.notebook.add_cell("x = 1")
+        await self.notebook.add_cell("x + 1")
+        loaded = Notebook.load("test_user", "test_session")
+        self.assertEqual(len(loaded.cells), 2)
+        self.assertEqual(loaded.execution_count, self.notebook.execution_count)
+        for original, restored in zip(self.notebook.cells, loaded.cells):
+            self.assertEqual(restored.serialize(), original.serialize())
+
+    def test_saved_file_is_plain_json(self):
+        self.notebook.save()
+        data = json.loads(self._notebook_path().read_text())
+        self.assertEqual(data["user_id"], "test_user")
+        self.assertEqual(data["cells"], [])
+
+    async def test_save_replaces_file_atomically(self):
+        await self.notebook.add_cell("x = 1")
+        before = self._notebook_path().read_bytes()
+        siblings = list(self._notebook_path().parent.glob("cells.json.tmp.*"))
+        self.assertEqual(siblings, [])
+        # Fail half-way through writing the cells: the old file must survive
+        cell = self.notebook.cells[0]
+        self.notebook._serialized_cells[cell.id] = (cell.cell_number, None)
+        with self.assertRaises(TypeError):
+            self.notebook.save()
+        self.assertEqual(self._notebook_path().read_bytes(), before)
+
+    async def test_execute_invalidates_serialized_cell(self):
+        cell = await self.notebook.add_cell("x = 1")
+        cached = self.notebook._serialized_cells[cell.id][1]
+        cell.code = "x = 2"
+        await self.notebook.execute_cell(cell.id)
+        self.assertNotEqual(self.notebook._serialized_cells[cell.id][1], cached)
+        loaded = Notebook.load("test_user", "test_session")
+        self.assertEqual(loaded.cells[0].code, "x = 2")
+        self.assertEqual(loaded.cells[0].outputs[0].content, "ran: x = 2")
+
+    async def test_delete_invalidates_serialized_cells(self):
+        first = await self.notebook.add_cell("a = 1", execute=False)
+        second = await self.notebook.add_cell("b = 2", execute=False)
+        self.notebook.delete_cell(first.id)
+        self.assertNotIn(first.id, self.notebook._serialized_cells)
+        loaded = Notebook.load("test_user", "test_session")
+        self.assertEqual([c.id for c in loaded.cells], [second.id])
+        data = json.loads(self._notebook_path().read_text())
+        self.assertEqual(data["cells"][0]["number"], 0)
+
+    async def test_clear_invalidates_serialized_cells(self):
+        await self.notebook.add_cell("a = 1", execute=False)
+        self.notebook.clear()
+        self.assertEqual(self.notebook._serialized_cells, {})
+        loaded = Notebook.load("test_user", "test_session")
+        self.assertEqual(loaded.cells, [])
+
+    def _assert_index_consistent(self):
+        for i, cell in enumerate(self.notebook.cells):
+            self.assertEqual(self.notebook._index_of(cell.id), i)
+            self.assertEqual(cell.cell_number, i)
+
+    async def test_index_of_after_insert(self):
+        await self.notebook.add_cell("a = 1", execute=False)
+        await self.notebook.add_cell("b = 2", execute=False)
+        inserted = await self.notebook.add_cell("c = 3", execute=False, number=0)
+        self.assertEqual(self.notebook.cells[0].id, inserted.id)
+        self._assert_index_consistent()
+
+    async def test_index_of_after_delete(self):
+        cells = [
+            await self.notebook.add_cell(f"v{i} = {i}", execute=False) for i in range(3)
+        ]
+        self.notebook.delete_cell(cells[1].id)
+        self._assert_index_consistent()
+        with self.assertRaises(ValueError):
+            self.notebook._index_of(cells[1].id)
+
+    async def test_getitem_by_id_and_number(self):
+        cell = await self.notebook.add_cell("a = 1", execute=False)
+        self.assertIs(self.notebook[cell.id], cell)
+        self.assertIs(self.notebook[0], cell)
+        with self.assertRaises(IndexError):
+            self.notebook[1]
+
+
+if __name__ == "__main__":
+    unittest.main()
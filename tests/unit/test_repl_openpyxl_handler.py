@@ -0,0 +1,58 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import openpyxl
+
+from agentic_patterns.core.repl.openpyxl_handler import (
+    load_workbook_from_reference,
+    save_workbook,
+)
+
+
+class TestOpenpyxlHandler(unittest.TestCase):
+    """Tests for agentic_patterns.core.repl.openpyxl_handler module."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _workbook(self) -> openpyxl.Workbook:
+        workbook = openpyxl.Workbook()
+        workbook.active["A1"] = "hello"
+        workbook.active["B2"] = 42
+        return workbook
+
+    def _assert_round_trip(self, ref) -> None:
+        loaded = load_workbook_from_reference(ref)
+        self.assertEqual(loaded.active["A1"].value, "hello")
+        self.assertEqual(loaded.active["B2"].value, 42)
+
+    def test_save_workbook_round_trip(self):
+        workbook = self._workbook()
+        workbook.properties.modified = None
+        ref = save_workbook(workbook, "wb", self.tmp_path)
+        self.assertEqual(ref.temp_path, self.tmp_path / "wb.xlsx")
+        self.assertIsNotNone(workbook.properties.modified)
+        self._assert_round_trip(ref)
+
+    def test_save_workbook_rejects_read_only(self):
+        path = save_workbook(self._workbook(), "wb", self.tmp_path).temp_path
+        read_only = openpyxl.load_workbook(path, read_only=True)
+        with self.assertRaises(TypeError):
+            save_workbook(read_only, "copy", self.tmp_path)
+        read_only.close()
+
+    def test_save_workbook_falls_back_to_workbook_save(self):
+        with mock.patch.dict(sys.modules, {"openpyxl.writer.excel": None}):
+            ref = save_workbook(self._workbook(), "wb", self.tmp_path)
+        self._assert_round_trip(ref)
+
+
+if __name__ == "__main__":
+    unittest.main()